@@ -30,19 +30,42 @@ Usage:
     >>> geogedcom.add_geocoding_callback(...)
 """
 
-from .addressbook import AddressBook
-from .gedcom import Gedcom, GenerationTracker
+import importlib
+
 from .gedcom_date import GedcomDate
-from .gedcom_parser import GedcomParser
 from .geocache import GeoCache
-from .geocode import Geocode
-from .geolocated_gedcom import GeolocatedGedcom
 from .lat_lon import LatLon
 from .location import Location
 from .person import LifeEvent, Partner, Person
 from .marriage import Marriage
 from .app_hooks import AppHooks
-from .geo_config import GeoConfig
+
+# Symbols whose modules pull in heavy third-party dependencies (geopy, rapidfuzz,
+# pycountry, yaml); imported on first attribute access (PEP 562)
+# so that tools only touching e.g. LatLon or GeoCache don't pay for them.
+_LAZY_IMPORTS = {
+    "AddressBook": ".addressbook",
+    "Gedcom": ".gedcom",
+    "GenerationTracker": ".gedcom",
+    "GedcomParser": ".gedcom_parser",
+    "Geocode": ".geocode",
+    "GeolocatedGedcom": ".geolocated_gedcom",
+    "GeoConfig": ".geo_config",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     # Core GEDCOM
@@ -9,6 +9,7 @@ Last updated: 2025-11-29
 """
 import os
 import re
+import sys
 from typing import Dict, List, Optional, TextIO, Union, Tuple
 import tempfile
 import shutil
@@ -48,6 +49,8 @@ class GedcomParser:
         'has_obje_tag',
         'only_use_photo_tags',
         '_stop_was_requested',
+        '_address_list',
+        '_all_places',
     ]
 
     LINE_RE = re.compile(
@@ -71,16 +74,31 @@ class GedcomParser:
         self.num_people = 0
         self.num_families = 0
         self._stop_was_requested = False
+        self._address_list: Optional[List[str]] = None
+        # Unique stripped places in first-seen order, filled in as parsed events are attached to people
+        self._all_places: Dict[str, None] = {}
+
+        # Normalise to Path once; accept Path inputs as-is
+        if isinstance(gedcom_file, (str, os.PathLike)) and not isinstance(gedcom_file, Path):
+            gedcom_file = Path(gedcom_file)
+        self.gedcom_file = gedcom_file
+        self.has_photo_tag, self.has_obje_tag = False, False
+        self.only_use_photo_tags = only_use_photo_tags
+
+        if gedcom_file is None:
+            return
+        if not isinstance(gedcom_file, Path) or not gedcom_file.is_file():
+            # One stat() up front instead of failing through every fix/count/read pass
+            logger.error(f"GEDCOM file not found: '{gedcom_file}'")
+            return
 
         self.gedcom_file = self._check_fix_gedcom(gedcom_file)
         self.gedcom_file = self._check_convert_legacy_gedcom(self.gedcom_file)
 
-        self.has_photo_tag, self.has_obje_tag = self._check_photo_tags(self.gedcom_file) if self.gedcom_file else (False, False)
+        self.has_photo_tag, self.has_obje_tag = self._check_photo_tags(self.gedcom_file)
         # if file has _PHOTO tags, prefer those, otherwise use both _PHOTO and OBJE
         if self.has_photo_tag:
             self.only_use_photo_tags = True
-        else:
-            self.only_use_photo_tags = only_use_photo_tags
 
         self._load_people_and_places()
 
@@ -144,7 +162,7 @@ class GedcomParser:
             logger.warning(f"Checked and made corrections to GEDCOM file '{input_path}' saved as {temp_path}")
         else:
             os.remove(temp_path)
-        return temp_path if changed else input_path
+        return Path(temp_path) if changed else input_path
 
     def _check_convert_legacy_gedcom(self, input_path: Path) -> Path:
         """Converts Legacy GEDCOM to GEDCOM 5.5 if needed."""
@@ -156,8 +174,9 @@ class GedcomParser:
         temp_fd, temp_path = tempfile.mkstemp(suffix='.ged')
         os.close(temp_fd)
 
+        temp_path = Path(temp_path)
         converter = GedcomLegacy(input_path)
-        changed = converter.legacy_convert(Path(temp_path))
+        changed = converter.legacy_convert(temp_path)
 
         if changed:
             logger.warning(f"Converted Legacy GEDCOM file '{input_path}' to GEDCOM 5.5 saved as {temp_path}")
@@ -167,9 +186,18 @@ class GedcomParser:
 
     def _check_if_tag_used(self, input_path: Path, tag: str) -> bool:
         """Check if GEDCOM file has a specific tag."""
-        has_tag = False
+        return tag in self._check_tags_used(input_path, (tag,))
+
+    def _check_tags_used(self, input_path: Path, tags: Tuple[str, ...]) -> set:
+        """
+        Return which of the given tags appear in the GEDCOM file, in a single streamed pass.
+
+        Stops reading as soon as every tag has been seen.
+        """
+        wanted = set(tags)
+        found = set()
         try:
-            with open(input_path, 'r', encoding='utf-8', newline='', errors="replace") as infile:
+            with open(input_path, 'r', encoding='utf-8', newline='', errors="replace", buffering=1 << 20) as infile:
                 for raw in infile:
                     line = raw.rstrip('\r\n')
                     m = self.LINE_RE.match(line)
@@ -177,18 +205,18 @@ class GedcomParser:
                         continue
 
                     level_s, current_tag, rest = m.groups()
-                    if current_tag == tag:
-                        has_tag = True
-                        break
+                    if current_tag in wanted:
+                        found.add(current_tag)
+                        if found == wanted:
+                            break
         except IOError as e:
-            logger.error(f"Failed to check GEDCOM file {input_path} for {tag} tags: {e}")
-        return has_tag
+            logger.error(f"Failed to check GEDCOM file {input_path} for {', '.join(tags)} tags: {e}")
+        return found
 
     def _check_photo_tags(self, input_path: Path) -> tuple[bool, bool]:
         """Check if GEDCOM file has photo tags (_PHOTO or OBJE)."""
-        has_photo_tag = self._check_if_tag_used(input_path, "_PHOTO")
-        has_obje_tag = self._check_if_tag_used(input_path, "OBJE")
-        return has_photo_tag, has_obje_tag
+        found = self._check_tags_used(input_path, ("_PHOTO", "OBJE"))
+        return "_PHOTO" in found, "OBJE" in found
 
     def __get_event_location(self, record: Record) -> Optional[LifeEvent]:
         """
@@ -202,8 +230,10 @@ class GedcomParser:
         """
         event = None
         if record:
-            place = record.sub_tag('PLAC').value if record.sub_tag('PLAC') else None
-            date = record.sub_tag('DATE').value if record.sub_tag('DATE') else None
+            plac = record.sub_tag('PLAC')
+            place = plac.value if plac else None
+            date_rec = record.sub_tag('DATE')
+            date = date_rec.value if date_rec else None
             event = LifeEvent(
                 place = place,
                 date = date,
@@ -213,6 +243,19 @@ class GedcomParser:
                 self._add_time_reference(event.date)
         return event
 
+    def _record_place(self, event: Optional[LifeEvent]) -> None:
+        """
+        Records the place of an event that has been attached to a person or marriage.
+
+        Args:
+            event (Optional[LifeEvent]): The attached event.
+        """
+        place = getattr(event, 'place', None)
+        if isinstance(place, str):
+            place_key = place.strip()
+            if place_key:
+                self._all_places[place_key] = None
+
     def _get_event_list(self, record: Record, tag: Union[str, List[str]]) -> List[LifeEvent]:
         """
         Extracts a list of events from a Record.
@@ -256,7 +299,7 @@ class GedcomParser:
         name: NameRec = record.sub_tag('NAME')
         if name:
             person.firstname = record.name.first
-            person.surname = record.name.surname
+            person.surname = sys.intern(record.name.surname) if record.name.surname else record.name.surname
             person.maidenname = record.name.maiden
             person.name = f'{record.name.format()}'
         if person.name == '':
@@ -264,7 +307,7 @@ class GedcomParser:
             person.surname = 'Unknown'
             person.maidenname = 'Unknown'
             person.name = 'Unknown'
-        person.sex = record.sex
+        person.sex = sys.intern(record.sex) if record.sex else record.sex
         person.add_event('birth', self.__get_event_location(record.sub_tag('BIRT')))
         person.add_event('death', self.__get_event_location(record.sub_tag('DEAT')))
         title = record.sub_tag("TITL")
@@ -280,6 +323,9 @@ class GedcomParser:
         # IDs from https://www.fhug.org.uk/kb/kb-article/handling-uncategorised-data-fields/#!
         military_tags = ('_MILT', '_MILTID','_MDCL','_MILTSVC','_MILTSTAT','_MILTRANK','_MILTETD')
         person.add_events('military', self._get_event_list(record, military_tags))
+        # Record this person's own event places; marriage places follow in the FAM pass
+        for event in person.iter_life_events():
+            self._record_place(event)
 
         # Grab photos
         photos_all, preferred_photos = self._extract_photos_from_record(record)
@@ -410,6 +456,8 @@ class GedcomParser:
                 marriage = Marriage(people_list=partner_person_list, marriage_event=marriage_event)
                 for person in partner_person_list:
                     person.add_event('marriage', marriage)
+                if partner_person_list:
+                    self._record_place(marriage_event)
 
             for child in record.sub_tags('CHIL'):
                 if child.xref_id in people:
@@ -477,6 +525,8 @@ class GedcomParser:
         self._report_step("Counting people", target=0)
         self._fast_count()
         self._stop_was_requested = False
+        self._address_list = None
+        self._all_places = {}
         try:
             # Single pass: build people and then addresses
             with GedcomReader(str(self.gedcom_file)) as g:
@@ -493,19 +543,33 @@ class GedcomParser:
 
     def get_full_address_list(self) -> List[str]:
         """
-        Returns a list of all unique places found in the GEDCOM file, preserving order.
+        Returns a list of all unique places found in the GEDCOM file, in first-seen order.
+
+        Places recorded while parsing come in file order: each individual's own
+        events as their INDI record is read, then marriage places from the FAM
+        records. This differs from the people-walk fallback, which lists a
+        person's marriage places alongside their other events, so the same
+        places can come back in a different order depending on the source.
+
+        The list is computed once and cached on the parser; callers should treat
+        it as read-only. A list cut short by a stop request is not cached.
 
         Returns:
             List[str]: List of unique place names.
         """
-        # Prefer collecting addresses from already-parsed in-memory people/events.
-        # This avoids reparsing large GEDCOM files and reduces peak memory usage.
-        addresses_from_people = self._get_full_address_list_from_people()
-        if addresses_from_people:
-            return addresses_from_people
+        if self._address_list is not None:
+            return self._address_list
 
-        # Fallback to file scan only when parser did not build people/events.
-        return self._get_full_address_list_from_reader()
+        # Prefer the places recorded while parsing, then the in-memory people/events.
+        # Both avoid reparsing large GEDCOM files and reduce peak memory usage.
+        address_list = list(self._all_places) or self._get_full_address_list_from_people()
+        if not address_list:
+            # Fallback to file scan only when parser did not build people/events.
+            address_list = self._get_full_address_list_from_reader()
+
+        if not self._stop_requested(logger_stop_message=""):
+            self._address_list = address_list
+        return address_list
 
     def _get_full_address_list_from_people(self) -> List[str]:
         """Collect unique places from already parsed people and their life events."""
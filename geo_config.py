@@ -53,6 +53,21 @@ class GeoConfig:
         default_country (str): Default country name.
         fallback_continent_map (Dict[str, str]): Fallback continent mapping for country codes.
     """
+    __slots__ = [
+        '__geo_config_path',
+        '__geo_config',
+        'countrynames',
+        'countrynames_lower',
+        'country_name_to_code_dict',
+        'country_code_to_continent_dict',
+        'country_code_to_name_dict',
+        'country_substitutions_lower',
+        'countrynames_dict_lower',
+        'subdivision_country_lookup',
+        'subdivision_display_lookup',
+        'default_country',
+        'fallback_continent_map',
+    ]
 
     def __init__(self, geo_config_path: Optional[Path] = None, geo_config_updates: Optional[dict] = None) -> None:
         """Initialize GeoConfig with country data and optional configuration.
@@ -74,6 +89,7 @@ class GeoConfig:
         self.country_substitutions_lower: dict = {}
         self.countrynames_dict_lower: dict = {}  # Initialize to empty dict
         self.subdivision_country_lookup: dict = {}
+        self.subdivision_display_lookup: dict = {}
         self.default_country = None
         self.fallback_continent_map = {}
 
@@ -113,9 +129,6 @@ class GeoConfig:
             The entire config dict if key is None, otherwise the value for the specified key.
             Returns default if key is not found.
         """
-        if not hasattr(self, '_GeoConfig__geo_config'):
-            return {} if key is None else default
-        
         if key is None:
             return self.__geo_config.copy()
         return self.__geo_config.get(key, default)
@@ -128,8 +141,6 @@ class GeoConfig:
             key: The configuration key to set.
             value: The value to set for the key.
         """
-        if not hasattr(self, '_GeoConfig__geo_config'):
-            self.__geo_config = {}
         self.__geo_config[key] = value
 
     def update_geo_config(self, settings_dict: dict) -> None:
@@ -139,8 +150,6 @@ class GeoConfig:
         Args:
             settings_dict: Dictionary of key-value pairs to update in the config.
         """
-        if not hasattr(self, '_GeoConfig__geo_config'):
-            self.__geo_config = {}
         self.__geo_config.update(settings_dict)
 
     def initialize_country_data(self) -> None:
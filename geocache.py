@@ -9,9 +9,10 @@ Author: @colin0brass
 import os
 import csv
 import logging
+from contextlib import nullcontext
 from pathlib import Path
 import time
-from typing import Dict, Optional, Tuple
+from typing import Dict, Iterable, Optional, Tuple
 from dataclasses import dataclass, asdict, field
 
 from geo_gedcom.location import Location
@@ -19,23 +20,67 @@ from geo_gedcom.lat_lon import LatLon
 
 logger = logging.getLogger(__name__)
 
+# String values read back from the cache CSV that count as True
+_TRUE = frozenset({'true', '1', 't', 'yes'})
+
+
+def _as_bool(value) -> bool:
+    """Coerce a CSV string (or already-typed value) to bool; note bool('false') would be True."""
+    if isinstance(value, str):
+        return value.strip().lower() in _TRUE
+    return bool(value)
+
 
-@dataclass
 class GeoCacheEntry:
     """
     Represents a single geocoded location cache entry.
+
+    A plain class with __slots__ rather than a dataclass (Python 3.8 has no
+    dataclass(slots=True)): caches hold one entry per distinct place, so
+    avoiding a per-instance __dict__ keeps large caches small.
     """
-    address: str
-    alt_addr: str = ''
-    latitude: str = ''
-    longitude: str = ''
-    country_code: str = ''
-    country_name: str = ''
-    continent: str = ''
-    found_country: bool = False
-    no_result: bool = False
-    timestamp: float = 0.0
-    used: int = 0
+    __slots__ = [
+        'address', 'alt_addr', 'latitude', 'longitude', 'country_code', 'country_name',
+        'continent', 'found_country', 'no_result', 'timestamp', 'used'
+    ]
+
+    def __init__(
+        self,
+        address: str,
+        alt_addr: str = '',
+        latitude: str = '',
+        longitude: str = '',
+        country_code: str = '',
+        country_name: str = '',
+        continent: str = '',
+        found_country: bool = False,
+        no_result: bool = False,
+        timestamp: float = 0.0,
+        used: int = 0
+    ):
+        """
+        Initialize a GeoCacheEntry.
+        """
+        self.address = address
+        self.alt_addr = alt_addr
+        self.latitude = latitude
+        self.longitude = longitude
+        self.country_code = country_code
+        self.country_name = country_name
+        self.continent = continent
+        self.found_country = found_country
+        self.no_result = no_result
+        self.timestamp = timestamp
+        self.used = used
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f"{slot}={getattr(self, slot)!r}" for slot in self.__slots__)
+        return f"GeoCacheEntry({fields})"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, GeoCacheEntry):
+            return NotImplemented
+        return all(getattr(self, slot) == getattr(other, slot) for slot in self.__slots__)
 
     @classmethod
     def from_dict(cls, d: dict) -> 'GeoCacheEntry':
@@ -47,27 +92,14 @@ class GeoCacheEntry:
         Returns:
             GeoCacheEntry: The constructed entry.
         """
-        found_country = d.get('found_country', False)
-        if isinstance(found_country, str):
-            found_country = found_country.lower() in ('true', '1')
-        else:
-            found_country = bool(found_country)
-        no_result = d.get('no_result', False)
-        if isinstance(no_result, str):
-            no_result = no_result.lower() in ('true', '1')
-        else:
-            no_result = bool(no_result)
-        timestamp = d.get('timestamp', 0.0)
+        timestamp = d.get('timestamp')
+        used = d.get('used')
         try:
-            if not timestamp or timestamp == '':
-                timestamp = 0.0
-            else:
-                timestamp = float(timestamp)
+            timestamp = float(timestamp) if timestamp else 0.0
         except (TypeError, ValueError):
             timestamp = 0.0
-        used = d.get('used', 0)
         try:
-            used = int(used)
+            used = int(used) if used else 0
         except (TypeError, ValueError):
             used = 0
         return cls(
@@ -78,8 +110,8 @@ class GeoCacheEntry:
             country_code=d.get('country_code', ''),
             country_name=d.get('country_name', ''),
             continent=d.get('continent', ''),
-            found_country=found_country,
-            no_result=no_result,
+            found_country=_as_bool(d.get('found_country', False)),
+            no_result=_as_bool(d.get('no_result', False)),
             timestamp=timestamp,
             used=used
         )
@@ -91,7 +123,7 @@ class GeoCacheEntry:
         Returns:
             dict: Dictionary representation of the entry.
         """
-        d = asdict(self)
+        d = {slot: getattr(self, slot) for slot in self.__slots__}
         # CSV expects 'True'/'False' strings for found_country and no_result
         d['found_country'] = 'True' if self.found_country else 'False'
         d['no_result'] = 'True' if self.no_result else 'False'
@@ -104,8 +136,6 @@ class GeoCacheEntry:
         """
         Allow safe attribute access for GeoCacheEntry, returning None for missing attributes.
         """
-        if name in self.__dataclass_fields__:
-            return self.__dict__.get(name)
         return None
 
     @classmethod
@@ -134,6 +164,10 @@ class GeoCacheEntry:
         )
 
 
+# CSV column order for the geocode cache file, one column per GeoCacheEntry slot
+GEO_CACHE_FIELDS = tuple(GeoCacheEntry.__slots__)
+
+
 @dataclass
 class GeoCacheAltAddrEntry:
     """
@@ -191,6 +225,7 @@ class GeoCache:
         geo_cache (Dict[str, dict]): Dictionary mapping place names to cached geocode data.
         alt_addr_cache (Dict[str, dict]): Dictionary mapping place names to alternative address data.
         time_between_retrying_failed_geocodes (int): Time in seconds to wait before retrying failed geocodes.
+        _dirty (bool): True when geo_cache differs from what is on disk; save_geo_cache is a no-op otherwise.
     """
 
     def __init__(
@@ -223,7 +258,10 @@ class GeoCache:
         self.time_between_retrying_failed_geocodes = days_between_retrying_failed_geocodes * 24 * 3600  # One day
 
         self.geo_cache = self.read_geo_cache(self.location_cache_file)
-        self.geo_cache.update(self.read_geo_cache(self.file_geo_cache_path))
+        file_geo_cache = self.read_geo_cache(self.file_geo_cache_path)
+        self.geo_cache.update(file_geo_cache)
+        # Entries merged from the per-file cache still need writing to the main cache file
+        self._dirty = bool(file_geo_cache)
         
         if alt_addr_file:
             self.read_alt_addr_file(alt_addr_file)
@@ -245,12 +283,13 @@ class GeoCache:
             logger.info(f'No location cache file found: {location_file_path}')
             return geo_cache
         try:
-            with open(location_file_path, newline='', encoding='utf-8') as f:
+            # Single buffered pass straight into the dict; no per-row method dispatch
+            with open(location_file_path, newline='', encoding='utf-8', buffering=1 << 20) as f:
                 csv_reader = csv.DictReader(f, dialect='excel')
-                for line in csv_reader:
-                    key = line.get('address', '').lower()
-                    entry = GeoCacheEntry.from_dict(line)
-                    geo_cache[key] = entry
+                geo_cache = {
+                    line.get('address', '').casefold(): GeoCacheEntry.from_dict(line)
+                    for line in csv_reader
+                }
         except FileNotFoundError as e:
             logger.warning(f'Location cache file not found: {e}')
         except csv.Error as e:
@@ -260,30 +299,35 @@ class GeoCache:
 
         return geo_cache
 
-    def save_geo_cache(self) -> None:
+    def save_geo_cache(self, lock=None) -> None:
         """
         Save geocoded location cache to the CSV file.
 
         Writes all cached geocoding results from self.geo_cache to disk.
         Ensures the 'found_country' field is saved as a 'True' or 'False' string.
-        """
-        if not self.geo_cache:
-            logger.info('No geocoded location cache to save')
-            return
-        try:
-            # Collect all fieldnames from all cache entries
-            all_fieldnames = set()
-            for entry in self.geo_cache.values():
-                all_fieldnames.update(entry.as_dict().keys())
-            fieldnames = list(all_fieldnames)
-            if not fieldnames:
-                logger.info('Geocoded location cache is empty, nothing to save.')
+
+        Args:
+            lock: Optional lock that writers to geo_cache hold while adding entries
+                (e.g. Geocode._lock for threaded lookups). The snapshot is taken and
+                the dirty flag cleared under it, so an entry added during the write
+                marks the cache dirty again and is saved next time.
+        """
+        with lock if lock is not None else nullcontext():
+            if not self.geo_cache:
+                logger.info('No geocoded location cache to save')
+                return
+            if not self._dirty:
+                logger.info('Geocoded location cache unchanged, nothing to save')
                 return
-            with open(self.location_cache_file, 'w', newline='', encoding='utf-8') as f:
-                csv_writer = csv.DictWriter(f, fieldnames=fieldnames, dialect='excel')
+            entries = list(self.geo_cache.values())
+            self._dirty = False
+        saved = False
+        try:
+            with open(self.location_cache_file, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+                csv_writer = csv.DictWriter(f, fieldnames=GEO_CACHE_FIELDS, dialect='excel')
                 csv_writer.writeheader()
-                for entry in self.geo_cache.values():
-                    csv_writer.writerow(entry.as_dict())
+                csv_writer.writerows(entry.as_dict() for entry in entries)
+            saved = True
             logger.info(f'Saved geocoded location cache to: {self.location_cache_file}')
         except FileNotFoundError as e:
             logger.warning(f'Location cache file not found for saving: {e}')
@@ -291,6 +335,11 @@ class GeoCache:
             logger.error(f'CSV error saving geocoded location cache: {e}')
         except Exception as e:
             logger.error(f'Error saving geocoded location cache: {e}')
+        finally:
+            if not saved:
+                # Nothing reached disk, so the cache is still unsaved
+                with lock if lock is not None else nullcontext():
+                    self._dirty = True
 
     def read_alt_addr_file(self, alt_addr_file: Optional[Path]) -> None:
         """
@@ -306,7 +355,7 @@ class GeoCache:
             with open(alt_addr_file, newline='', encoding='utf-8') as f:
                 csv_reader = csv.DictReader(f, dialect='excel')
                 for line in csv_reader:
-                    key = line.get('address', '').lower()
+                    key = line.get('address', '').casefold()
                     entry = GeoCacheAltAddrEntry.from_dict(line)
                     self.alt_addr_cache[key] = entry
         except FileNotFoundError as e:
@@ -332,6 +381,7 @@ class GeoCache:
         Update a cache entry with alternative address data.
         """
         cache_entry.alt_addr = alt_addr_entry.alt_addr
+        self._dirty = True
         if alt_addr_entry.latitude and alt_addr_entry.longitude:
             cache_entry.latitude = alt_addr_entry.latitude
             cache_entry.longitude = alt_addr_entry.longitude
@@ -346,19 +396,21 @@ class GeoCache:
         Returns:
             Tuple[str, Optional[dict]]: (possibly substituted address, cached geocode data if found, else None)
         """
-        address_lower = address.lower()
-        alt_addr_entry: Optional[GeoCacheAltAddrEntry] = self.alt_addr_cache.get(address_lower)
+        # Cache keys are case-folded once on insert; fold the query once here
+        address_key = address.casefold()
+        alt_addr_entry: Optional[GeoCacheAltAddrEntry] = self.alt_addr_cache.get(address_key)
         alt_addr_name: Optional[str] = alt_addr_entry.alt_addr if alt_addr_entry else None
 
         use_addr_name = alt_addr_name if alt_addr_name else address
 
-        cache_entry: Optional[GeoCacheEntry] = self.geo_cache.get(address_lower)
+        cache_entry: Optional[GeoCacheEntry] = self.geo_cache.get(address_key)
         if cache_entry:
             if cache_entry.no_result:
                 # In cache_only mode, never retry failed lookups
                 if not self.cache_only and self._should_retry_failed_geocode(cache_entry):
                     logger.debug(f"Retrying geocode for previously failed address: {address}")
-                    del self.geo_cache[address_lower]
+                    self.geo_cache.pop(address_key, None)
+                    self._dirty = True
                     return use_addr_name, None
                 return use_addr_name, cache_entry
 
@@ -381,7 +433,8 @@ class GeoCache:
             no_result=True,
             timestamp=time.time()
         )
-        self.geo_cache[address.lower()] = entry
+        self.geo_cache[address.casefold()] = entry
+        self._dirty = True
 
     def add_geo_cache_entry(self, address: str, location: Location) -> None:
         """
@@ -392,7 +445,20 @@ class GeoCache:
             location (Location): The geocoded location object.
         """
         entry = GeoCacheEntry.from_location(address, location)
-        self.geo_cache[address.lower()] = entry
+        self.geo_cache[address.casefold()] = entry
+        self._dirty = True
+
+    def add_entries(self, items: Iterable[Tuple[str, GeoCacheEntry]]) -> None:
+        """
+        Add many (address, entry) pairs to the cache in one dict update, e.g. when merging caches.
+
+        Args:
+            items (Iterable[Tuple[str, GeoCacheEntry]]): Address strings and their cache entries.
+        """
+        entries = {address.casefold(): entry for address, entry in items}
+        if entries:
+            self.geo_cache.update(entries)
+            self._dirty = True
 
     def add_alt_addr_to_cache(self) -> None:
         """
@@ -401,7 +467,8 @@ class GeoCache:
         Iterates through alt_addr_cache and adds entries to geo_cache if not already present.
         """
         for address, data in self.alt_addr_cache.items():
-            if address.lower() not in self.geo_cache:
+            # alt_addr_cache keys are already case-folded
+            if address not in self.geo_cache:
                 logger.debug(f"Adding alternative address to cache: {address} : {data.get('alt_addr')}")
                 # Use the real Location class for temporary location creation
                 lat = data.get('latitude', '')
@@ -420,4 +487,5 @@ class GeoCache:
                 entry.no_result = False
                 entry.timestamp = time.time()
                 entry.used = 0
-                self.geo_cache[address.lower()] = entry
+                self.geo_cache[address] = entry
+                self._dirty = True
@@ -11,8 +11,11 @@ import time
 import logging
 import random
 import re
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple, Dict
+from typing import Optional, Tuple, Dict, Iterable, Iterator
 
 import requests
 from geopy.geocoders import Nominatim
@@ -45,16 +48,18 @@ class Geocode:
         geolocator (Nominatim): Geopy Nominatim geocoder instance.
         geo_config (GeoConfig): Geographic configuration instance.
         app_hooks (Optional[AppHooks]): Optional application hooks for progress reporting.
+        max_workers (int): Number of threads used by lookup_locations; geocode_settings 'max_workers', default 1 (sequential).
         _last_geocode_time (float): Timestamp of the last geocode request.
+        _lock (threading.Lock): Guards the rate-limit timestamp, counters and cache writes across threads.
     """
 
     __slots__ = [
         'default_country', 'always_geocode', 'cache_only', 'geo_config', 'location_cache_file', 'additional_countries_codes_dict_to_add',
         'additional_countries_to_add', 'country_substitutions', 'geo_cache',
-        'geolocator', 'geo_config', 'app_hooks', '_last_geocode_time',
+        'geolocator', 'geo_config', '_app_hooks', '_report_step_hook', '_stop_requested_hook', '_last_geocode_time',
         'num_geocoded', 'num_from_cache', 'num_from_cache_no_location_result',
         'max_retries', 'retry_delay', 'backoff_base', 'geocode_timeout', 'days_between_retrying_failed_lookups',
-        'get_continent_for_country_code', 'get_place_and_countrycode'
+        'get_continent_for_country_code', 'get_place_and_countrycode', 'max_workers', '_lock'
     ]
 
     # Class constants
@@ -89,6 +94,8 @@ class Geocode:
         self.backoff_base = geocode_settings.get('backoff_base', 0.5)
         self.geocode_timeout = geocode_settings.get('timeout', 10.0)
         self.days_between_retrying_failed_lookups = geocode_settings.get('days_between_retrying_failed_lookups', 7)
+        # Threaded lookups are opt-in; the default of 1 keeps geocoding sequential
+        self.max_workers = max(1, int(geocode_settings.get('max_workers', 1)))
         self.get_continent_for_country_code = geo_config.get_continent_for_country_code
         self.get_place_and_countrycode = geo_config.get_place_and_countrycode
 
@@ -100,11 +107,26 @@ class Geocode:
         self.app_hooks = app_hooks
 
         self._last_geocode_time = 0.0  # Timestamp of last geocode request
+        self._lock = threading.Lock()
 
         self.num_geocoded = 0
         self.num_from_cache = 0
         self.num_from_cache_no_location_result = 0
 
+    @property
+    def app_hooks(self) -> Optional['AppHooks']:
+        """Optional application hooks for progress reporting and stop requests."""
+        return self._app_hooks
+
+    @app_hooks.setter
+    def app_hooks(self, app_hooks: Optional['AppHooks']) -> None:
+        """Store the hooks and resolve the optional callbacks once, not on every progress step."""
+        self._app_hooks = app_hooks
+        report_step = getattr(app_hooks, "report_step", None) if app_hooks else None
+        stop_requested = getattr(app_hooks, "stop_requested", None) if app_hooks else None
+        self._report_step_hook = report_step if callable(report_step) else None
+        self._stop_requested_hook = stop_requested if callable(stop_requested) else None
+
     def save_geo_cache(self) -> None:
         """
         Save address cache to disk if applicable.
@@ -114,13 +136,21 @@ class Geocode:
             logger.debug("Skipping cache save in cache_only mode")
             return
         if self.geo_cache.location_cache_file:
-            self.geo_cache.save_geo_cache()
+            # Lookups on worker threads add entries under the same lock
+            self.geo_cache.save_geo_cache(lock=self._lock)
 
     def _wait_for_rate_limit(self) -> None:
-        """Wait if necessary to respect rate limiting between geocoding requests."""
-        last_ts = getattr(self, "_last_geocode_time", 0.0)
-        now = time.time()
-        to_wait = self.retry_delay - (now - last_ts)
+        """
+        Wait if necessary to respect rate limiting between geocoding requests.
+
+        Each caller reserves the next free request slot under the lock and then
+        sleeps outside it, so concurrent lookups stay spaced by retry_delay.
+        """
+        with self._lock:
+            now = time.time()
+            slot = max(now, self._last_geocode_time + self.retry_delay)
+            self._last_geocode_time = slot
+        to_wait = slot - now
         if to_wait > 0:
             time.sleep(to_wait)
 
@@ -135,7 +165,6 @@ class Geocode:
         Returns:
             The geocoding result or None if no match found.
         """
-        self._last_geocode_time = time.time()
         ccodes = country_code if (country_code and country_code.lower() != 'none') else None
         return self.geolocator.geocode(
             address, country_codes=ccodes, timeout=self.geocode_timeout,
@@ -331,9 +360,9 @@ class Geocode:
             if idx % 100 == 0:
                 self._report_step(plus_step=100)
 
-            place_lower = place.lower()
-            if not self.always_geocode and (place_lower in self.geo_cache.geo_cache):
-                if self.geo_cache.geo_cache[place_lower].no_result:
+            place_key = place.casefold()
+            if not self.always_geocode and (place_key in self.geo_cache.geo_cache):
+                if self.geo_cache.geo_cache[place_key].no_result:
                     cached_places_without_geolocation.add_address(place, data)
                 else:
                     cached_places_with_geolocation.add_address(place, data)
@@ -367,16 +396,20 @@ class Geocode:
         use_place_name = place
         cache_entry = None
         if not self.always_geocode:
-            use_place_name, cache_entry = self.geo_cache.lookup_geo_cache_entry(place)
+            # The lookup may drop a stale failed entry, so it is a cache write too
+            with self._lock:
+                use_place_name, cache_entry = self.geo_cache.lookup_geo_cache_entry(place)
 
         if cache_entry and cache_entry.no_result:
-            self.num_from_cache_no_location_result += 1
+            with self._lock:
+                self.num_from_cache_no_location_result += 1
             return None
 
         (place_with_country, country_code, country_name, found_country) = self.get_place_and_countrycode(use_place_name)
 
         if cache_entry and not self.always_geocode:
-            self.num_from_cache += 1
+            with self._lock:
+                self.num_from_cache += 1
             if cache_entry.latitude and cache_entry.longitude:
                 found_in_cache = True
                 location = Location.from_dict(cache_entry)
@@ -388,21 +421,25 @@ class Geocode:
                         location.country_code = country_code.upper()
                         location.country_name = country_name
                         location.continent = self.get_continent_for_country_code(country_code)
-                        self.geo_cache.add_geo_cache_entry(place, location)
+                        with self._lock:
+                            self.geo_cache.add_geo_cache_entry(place, location)
                     else:
                         logger.debug(f"Unable to add country from geo cache lookup for {use_place_name}")
                 if not location.found_country:
                     logger.debug(f"Country not found in cache for {use_place_name}")
 
         if not found_in_cache and not self.cache_only:
-            self.num_geocoded += 1
+            with self._lock:
+                self.num_geocoded += 1
             location = self.geocode_address(place_with_country, country_code, country_name, found_country, address_depth=0)
             if location is not None:
                 location.address = place
-                self.geo_cache.add_geo_cache_entry(place, location)
+                with self._lock:
+                    self.geo_cache.add_geo_cache_entry(place, location)
                 logger.debug(f"Geocoded {place} to {location.latlon}")
             else: # record negative cache so we avoid re-trying repeatedly
-                self.geo_cache.add_no_result_entry(place)
+                with self._lock:
+                    self.geo_cache.add_no_result_entry(place)
                 logger.debug(f"Geocoding couldn't find {place}, so marked as no_result to reduce fruitless attempts.")
 
         if location:
@@ -412,6 +449,38 @@ class Geocode:
 
         return location
 
+    def lookup_locations(self, places: Iterable[str]) -> Iterator[Tuple[str, Optional[Location]]]:
+        """
+        Look up several places, overlapping network waits across worker threads.
+
+        Results are yielded in input order as (place, location) pairs. Requests
+        are still spaced by the configured rate limit; threads only hide the
+        per-request latency. At most 2 * max_workers lookups are in flight, so
+        closing the generator early (e.g. on a stop request) returns promptly.
+
+        Args:
+            places (Iterable[str]): Place strings to look up.
+
+        Yields:
+            Tuple[str, Optional[Location]]: Each place and its Location or None.
+        """
+        if self.max_workers <= 1 or self.cache_only:
+            for place in places:
+                yield place, self.lookup_location(place)
+            return
+
+        window = 2 * self.max_workers
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = deque()
+            for place in places:
+                pending.append((place, executor.submit(self.lookup_location, place)))
+                if len(pending) >= window:
+                    done_place, future = pending.popleft()
+                    yield done_place, future.result()
+            while pending:
+                done_place, future = pending.popleft()
+                yield done_place, future.result()
+
     def _report_step(self, info: str = "", target: Optional[int] = None, reset_counter: bool = False, plus_step: int = 0) -> None:
         """Report a step via app hooks if available.
 
@@ -421,8 +490,8 @@ class Geocode:
             reset_counter (bool): Whether to reset the counter.
             plus_step (int): Incremental step count.
         """
-        if self.app_hooks and callable(getattr(self.app_hooks, "report_step", None)):
-            self.app_hooks.report_step(info=info, target=target, reset_counter=reset_counter, plus_step=plus_step)
+        if self._report_step_hook:
+            self._report_step_hook(info=info, target=target, reset_counter=reset_counter, plus_step=plus_step)
         else:
             logger.debug(info)
 
@@ -435,8 +504,8 @@ class Geocode:
         Returns:
             bool: True if stop requested, False otherwise.
         """
-        if self.app_hooks and callable(getattr(self.app_hooks, "stop_requested", None)):
-            if self.app_hooks.stop_requested():
+        if self._stop_requested_hook:
+            if self._stop_requested_hook():
                 if logger_stop_message:
                     logger.info(logger_stop_message)
                 return True
@@ -173,32 +173,36 @@ class GeolocatedGedcom(Gedcom):
         num_places = address_book.len()
         self._report_step(progress_message, target=num_places, reset_counter=True)
 
-        for idx, (place, data) in enumerate(address_book.addresses().items(), 1):
-            use_place = data.alt_addr if data.alt_addr else place
-            location = self.geocoder.lookup_location(use_place)
+        places = list(address_book.addresses().items())
+        # Lookups may run ahead on worker threads; results come back in order
+        results = self.geocoder.lookup_locations(
+            data.alt_addr if data.alt_addr else place for place, data in places)
+        try:
+            for idx, ((place, data), (_, location)) in enumerate(zip(places, results), 1):
+                # Add to address book with appropriate location
+                if force_none_location:
+                    self.address_book.add_address(place, None)
+                else:
+                    self.address_book.add_address(place, location)
 
-            # Add to address book with appropriate location
-            if force_none_location:
-                self.address_book.add_address(place, None)
-            else:
-                self.address_book.add_address(place, location)
+                # Check for stop request
+                if self._stop_requested(logger_stop_message="Geolocation process stopped by user."):
+                    return True
 
-            # Check for stop request
-            if self._stop_requested(logger_stop_message="Geolocation process stopped by user."):
-                return True
-
-            # Report progress at intervals
-            if idx % self.geolocate_all_logger_interval == 0 or idx == num_places:
-                # Calculate the actual step amount (handle remainder for last item)
-                if idx == num_places:
-                    step_amount = num_places % self.geolocate_all_logger_interval or self.geolocate_all_logger_interval
-                else:
-                    step_amount = self.geolocate_all_logger_interval
-                self._report_step(plus_step=step_amount, info=progress_message)
+                # Report progress at intervals
+                if idx % self.geolocate_all_logger_interval == 0 or idx == num_places:
+                    # Calculate the actual step amount (handle remainder for last item)
+                    if idx == num_places:
+                        step_amount = num_places % self.geolocate_all_logger_interval or self.geolocate_all_logger_interval
+                    else:
+                        step_amount = self.geolocate_all_logger_interval
+                    self._report_step(plus_step=step_amount, info=progress_message)
 
-            # Save cache periodically if requested
-            if save_cache_interval > 0 and idx % save_cache_interval == 0:
-                self.save_location_cache()
+                # Save cache periodically if requested
+                if save_cache_interval > 0 and idx % save_cache_interval == 0:
+                    self.save_location_cache()
+        finally:
+            results.close()
 
         return False
 
@@ -13,14 +13,17 @@ __all__ = ['LatLon']
 from typing import Optional, Union
 
 class LatLon:
-    __slots__ = ['lat', 'lon']
     """
     LatLon class for representing and validating latitude/longitude coordinates.
 
+    Instances are immutable value objects: they compare and hash by (lat, lon),
+    so they can be used as dict keys or in sets for de-duplication.
+
     Attributes:
         lat (Optional[float]): Latitude value.
         lon (Optional[float]): Longitude value.
     """
+    __slots__ = ['lat', 'lon']
 
     def __init__(self, lat: Union[str, float, None], lon: Union[str, float, None]):
         """
@@ -30,8 +33,26 @@ class LatLon:
             lat (str|float|None): Latitude value or string.
             lon (str|float|None): Longitude value or string.
         """
-        self.lat = self._parse_lat(lat)
-        self.lon = self._parse_lon(lon)
+        object.__setattr__(self, 'lat', self._parse_lat(lat))
+        object.__setattr__(self, 'lon', self._parse_lon(lon))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        # Rebuild through __init__ so copy, deepcopy and pickle bypass __setattr__
+        return (type(self), (self.lat, self.lon))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, LatLon):
+            return NotImplemented
+        return self.lat == other.lat and self.lon == other.lon
+
+    def __hash__(self) -> int:
+        return hash((self.lat, self.lon))
 
     @staticmethod
     def _parse_lat(lat: Union[str, float, None]) -> Optional[float]:
@@ -44,8 +65,8 @@ class LatLon:
         Returns:
             Optional[float]: Parsed latitude or None.
         """
-        if lat is None:
-            return None
+        if lat is None or type(lat) is float:
+            return lat
         if isinstance(lat, (float, int)):
             return float(lat)
         lat_str = str(lat).strip()
@@ -74,8 +95,8 @@ class LatLon:
         Returns:
             Optional[float]: Parsed longitude or None.
         """
-        if lon is None:
-            return None
+        if lon is None or type(lon) is float:
+            return lon
         if isinstance(lon, (float, int)):
             return float(lon)
         lon_str = str(lon).strip()
@@ -109,7 +130,7 @@ class LatLon:
     
     def hasLocation(self):
         """ Does this Position have a actual value """
-        return bool(getattr(self, "lat", None) and getattr(self, "lon", None))
+        return bool(self.lat and self.lon)
         
     def is_valid(self) -> bool:
         """
@@ -12,6 +12,7 @@ Author: @colin0brass
 Last updated: 2025-12-06
 """
 
+import sys
 from typing import Optional, List, Union
 from ged4py.model import Record
 from ged4py.date import DateValue
@@ -48,9 +49,10 @@ class LifeEvent:
             what (Optional[str]): Type of event (e.g., 'BIRT', 'DEAT').
             record (Optional[Record]): GEDCOM record.
         """
-        self.place: str = place
+        # Places and event tags repeat across thousands of events; share one string each
+        self.place: str = sys.intern(place) if isinstance(place, str) else place
         self.date: GedcomDate = GedcomDate(date)
-        self.what: Optional[str] = what
+        self.what: Optional[str] = sys.intern(what) if isinstance(what, str) else what
         self.record: Optional[Record] = record
         self.location: Location = Location(latlon=latlon, address=place) if latlon or place else None
 
@@ -67,7 +69,7 @@ class LifeEvent:
         """
         Returns a string describing the event (date and place).
         """
-        place = f" at {self.getattr('place')}" if self.place is not None else ""
+        place = f" at {self.place or None}" if self.place is not None else ""
         date_str = ""
         if self.date:
             date_str = self.date.year_str
@@ -78,16 +80,9 @@ class LifeEvent:
         """
         Returns the value of a named attribute for the event, with some aliases.
         """
-        if attr == 'latlon':
-            return self.location.latlon if self.location else LatLon(None, None)
-        elif attr == 'when' or attr == 'date':
-            return self.date.resolved if self.date else None
-        elif attr == "when_year_num":
-            return self.date.year_num if self.date else None
-        elif attr == 'where' or attr == 'place' or attr == 'location':
-            return self.place if self.place else None
-        elif attr == 'what':
-            return self.what if self.what else ""
+        getter = _EVENT_ATTR_GETTERS.get(attr)
+        if getter is not None:
+            return getter(self)
         import logging
         logger = logging.getLogger(__name__)
         logger.warning("LifeEvent attr: %s' object has no attribute '%s'", type(self).__name__, attr)
@@ -97,4 +92,23 @@ class LifeEvent:
         """
         Returns a string summary of the event (place, date, latlon, what).
         """
-        return f"{self.getattr('place')} : {self.getattr('date')} - {self.getattr('latlon')} {self.getattr('what')}"
+        # Same values as the getattr aliases, read straight from the slots
+        date = self.date.resolved if self.date else None
+        latlon = self.location.latlon if self.location else _NO_LATLON
+        return f"{self.place or None} : {date} - {latlon} {self.what or ''}"
+
+
+# LatLon is immutable, so events without a location can all share one empty value
+_NO_LATLON = LatLon(None, None)
+
+# LifeEvent.getattr aliases, looked up in one dict probe rather than an if/elif chain
+_EVENT_ATTR_GETTERS = {
+    'latlon': lambda ev: ev.location.latlon if ev.location else _NO_LATLON,
+    'when': lambda ev: ev.date.resolved if ev.date else None,
+    'date': lambda ev: ev.date.resolved if ev.date else None,
+    'when_year_num': lambda ev: ev.date.year_num if ev.date else None,
+    'where': lambda ev: ev.place if ev.place else None,
+    'place': lambda ev: ev.place if ev.place else None,
+    'location': lambda ev: ev.place if ev.place else None,
+    'what': lambda ev: ev.what if ev.what else "",
+}
@@ -12,12 +12,32 @@ Author: @colin0brass
 Last updated: 2025-12-06
 """
 
+import heapq
 from typing import Optional, List, Union, Dict, TypeVar, Generic
 from .life_event import LifeEvent
 from .marriage import Marriage
 
 T = TypeVar('T', bound=Union[LifeEvent, Marriage])
 
+
+def _date_sort_key(ev):
+    """Return a sortable value for an event's date (year_num, resolved, raw date or str)."""
+    d = getattr(ev, 'date', None)
+    if d is None:
+        return ''
+    # year_num and resolved are computed properties; read each one once
+    year_num = getattr(d, 'year_num', None)
+    if year_num is not None:
+        return year_num
+    resolved = getattr(d, 'resolved', None)
+    if resolved is not None:
+        return resolved
+    raw = getattr(d, 'date', None)
+    if raw is not None:
+        return raw
+    return str(d)
+
+
 class LifeEventSet(Generic[T]):
     """
     Represents a set of life events for a person, organized by event_type.
@@ -26,7 +46,10 @@ class LifeEventSet(Generic[T]):
         events (Dict[str, List[LifeEvent|Marriage]]): Dictionary mapping event_type to list of LifeEvent or Marriage.
         event_types (List[str]): List of allowed event types. If empty, all types are allowed unless allow_new_event_types is False.
         allow_new_event_types (bool): Whether to allow new event types not in event_types.
+        _sorted_cache (Dict[str, List[LifeEvent|Marriage]]): Date-ordered lists by event_type ('all' included), dropped when that type changes.
     """
+    __slots__ = ['events', 'event_types', 'allow_new_event_types', '_sorted_cache']
+
     def __init__(self, event_types: Optional[List[str]] = None, allow_new_event_types: bool = False) -> None:
         """
         Initialize an empty LifeEventSet.
@@ -38,6 +61,7 @@ class LifeEventSet(Generic[T]):
         self.events: Dict[str, List[Union[LifeEvent, Marriage]]] = {}
         self.event_types: List[str] = event_types if event_types else []
         self.allow_new_event_types: bool = allow_new_event_types
+        self._sorted_cache: Dict[str, List[Union[LifeEvent, Marriage]]] = {}
 
     def set_event_types(self, event_types: List[str], allow_new_event_types: Optional[bool] = None) -> None:
         """
@@ -69,11 +93,28 @@ class LifeEventSet(Generic[T]):
         # Accept both single event and list of events
         if not isinstance(events, list):
             events = [events]
-        if event_type not in self.events:
-            self.events[event_type] = []
-        for ev in events:
-            if ev is not None:
-                self.events[event_type].append(ev)
+        # One dict lookup and one extend for the whole batch
+        added = [ev for ev in events if ev is not None]
+        self.events.setdefault(event_type, []).extend(added)
+        self._merge_into_sorted_cache(event_type, added)
+        self._sorted_cache.pop('all', None)
+
+    def _merge_into_sorted_cache(self, event_type: str, added: List[Union[LifeEvent, Marriage]]) -> None:
+        """
+        Keep an existing date-ordered list for event_type current after an add.
+
+        The new events are sorted on their own and merged in, which is linear in
+        the cached list rather than a full re-sort; heapq.merge keeps earlier
+        events first on equal dates, matching what sorted() would give. The
+        cache entry is dropped instead if the dates cannot be compared.
+        """
+        cached = self._sorted_cache.get(event_type)
+        if cached is None or not added:
+            return
+        try:
+            self._sorted_cache[event_type] = list(heapq.merge(cached, sorted(added, key=_date_sort_key), key=_date_sort_key))
+        except Exception:
+            del self._sorted_cache[event_type]
 
     def add_event(self, event_type: str, event: Union[LifeEvent, Marriage]) -> None:
         """
@@ -96,28 +137,40 @@ class LifeEventSet(Generic[T]):
         Returns:
             List[LifeEvent|Marriage]: List of matching life events.
         """
+        if date_order:
+            # Hand out a copy so callers can't disturb the cached order
+            return list(self._sorted_events(event_type))
+        return self._collect_events(event_type)
+
+    def _sorted_events(self, event_type: str) -> List[Union[LifeEvent, Marriage]]:
+        """
+        Return the cached date-ordered list for event_type, building it if needed.
+
+        Each type is sorted once and reused until that type changes; 'all' is a
+        k-way heapq.merge of the per-type sorted lists rather than a full re-sort.
+        """
+        cached = self._sorted_cache.get(event_type)
+        if cached is None:
+            try:
+                if event_type == 'all':
+                    cached = list(heapq.merge(*(self._sorted_events(t) for t in self.events), key=_date_sort_key))
+                else:
+                    cached = sorted(self._collect_events(event_type), key=_date_sort_key)
+            except Exception:
+                # If sorting fails, keep insertion order; not cached, since adds
+                # merge into cached lists on the assumption they are date-ordered
+                return list(self._collect_events(event_type))
+            self._sorted_cache[event_type] = cached
+        return cached
+
+    def _collect_events(self, event_type: str) -> List[Union[LifeEvent, Marriage]]:
+        """Return the events of one type, or of every type for 'all', in insertion order."""
         if event_type == 'all':
             events: List[Union[LifeEvent, Marriage]] = []
             for ev_list in self.events.values():
                 events.extend(ev_list)
         else:
             events = self.events.get(event_type, [])
-        if date_order:
-            def get_date(ev):
-                d = getattr(ev, 'date', None)
-                # Try to get a sortable value (year_num or resolved or str)
-                if hasattr(d, 'year_num') and d.year_num is not None:
-                    return d.year_num
-                if hasattr(d, 'resolved') and d.resolved is not None:
-                    return d.resolved
-                if hasattr(d, 'date') and d.date is not None:
-                    return d.date
-                return str(d) if d is not None else ''
-            try:
-                events = sorted(events, key=get_date)
-            except Exception as e:
-                # If sorting fails, return unsorted
-                pass
         return events
 
     def get_event(self, event_type: str, date_order: bool = False) -> Optional[Union[LifeEvent, Marriage]]:
@@ -131,5 +184,6 @@ class LifeEventSet(Generic[T]):
         Returns:
             LifeEvent or Marriage or None: The first matching life event, or None if not found.
         """
-        events = self.get_events(event_type, date_order=date_order)
+        # Read the cached list directly; no need to copy it just to take the head
+        events = self._sorted_events(event_type) if date_order else self._collect_events(event_type)
         return events[0] if events else None
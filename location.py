@@ -15,7 +15,6 @@ __all__ = ['Location']
 
 import logging
 from typing import Dict, Optional, Union
-from rapidfuzz import process, fuzz
 from .lat_lon import LatLon
 
 # Re-use higher-level logger (inherits configuration from main script)
@@ -51,7 +51,7 @@ class Marriage:
         Returns:
             List[Person]: List of other partners in the marriage.
         """
-        return [p for p in self.people_list if p != person]
+        return [p for p in self.people_list if p is not person]
 
     def partner(self, person: "Person") -> "Person":
         """Return the first partner that is not the given person.
@@ -61,4 +61,4 @@ class Marriage:
         Returns:
             Person: The first other partner in the marriage, or None if not found.
         """
-        return self.other_partners(person)[0] if self.other_partners(person) else None
+        return next((p for p in self.people_list if p is not person), None)
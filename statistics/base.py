@@ -6,7 +6,8 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 import logging
-from typing import Any, Dict, Iterable, Type
+from collections.abc import Sized
+from typing import Any, Dict, Iterable, List, Optional, Type
 
 from geo_gedcom.statistics.model import Stats
 
@@ -28,6 +29,9 @@ def register_collector(cls: Type['StatisticsCollector']) -> Type['StatisticsColl
             ...
     """
     if hasattr(cls, 'collector_id'):
+        # Idempotent so that re-importing a collector module does not re-register it
+        if _COLLECTOR_REGISTRY.get(cls.collector_id) is cls:
+            return cls
         _COLLECTOR_REGISTRY[cls.collector_id] = cls
         logger.debug(f"Registered statistics collector: {cls.collector_id}")
     else:
@@ -58,16 +62,20 @@ class StatisticsCollector(ABC):
     app_hooks: Any = None
     
     @abstractmethod
-    def collect(self, people: Iterable[Any], existing_stats: Stats, collector_num: int = None, total_collectors: int = None) -> Stats:
+    def collect(self, people: Iterable[Any], existing_stats: Stats, collector_num: int = None, total_collectors: int = None) -> Optional[Stats]:
         """
         Collect statistics from the dataset.
         
+        Collectors write their values directly into existing_stats and return
+        it, so the pipeline shares one Stats object across all collectors.
+        
         Args:
-            people: Iterable of Person or EnrichedPerson objects
+            people: Iterable of Person or EnrichedPerson objects (the pipeline
+                passes a list, so len() and repeated iteration are cheap)
             existing_stats: Existing statistics object to add to
             
         Returns:
-            Stats object with collected values
+            existing_stats with collected values added, or None if nothing was collected
         """
         pass
     
@@ -76,6 +84,32 @@ class StatisticsCollector(ABC):
         if not self.collector_id:
             raise ValueError(f"{self.__class__.__name__} must define collector_id")
     
+    @staticmethod
+    def _count_people(people: Iterable[Any]) -> int:
+        """Count people, using len() when the iterable is Sized instead of materializing it.
+        
+        Args:
+            people: Iterable of Person or EnrichedPerson objects.
+        
+        Returns:
+            int: Number of people.
+        """
+        if isinstance(people, Sized):
+            return len(people)
+        return sum(1 for _ in people)
+    
+    @staticmethod
+    def _as_list(people: Iterable[Any]) -> List[Any]:
+        """Return people as a list, reusing the pipeline's list instead of copying it.
+        
+        Args:
+            people: Iterable of Person or EnrichedPerson objects.
+        
+        Returns:
+            List[Any]: The same list if one was passed, otherwise a new list.
+        """
+        return people if isinstance(people, list) else list(people)
+    
     def _report_step(self, info: str = "", target: int = None, reset_counter: bool = False, plus_step: int = 0) -> None:
         """Report a step via app hooks if available.
         
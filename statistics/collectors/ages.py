@@ -33,10 +33,10 @@ class AgesCollector(StatisticsCollector):
 
     def collect(self, people: Iterable[Any], existing_stats: Stats, collector_num: int = None, total_collectors: int = None) -> Stats:
         """Collect age statistics."""
-        stats = Stats()
+        stats = existing_stats
 
         # Convert to list for progress tracking
-        people_list = list(people)
+        people_list = self._as_list(people)
         total_people = len(people_list)
 
         # Build collector prefix
@@ -63,10 +63,10 @@ class BirthsCollector(StatisticsCollector):
 
     def collect(self, people: Iterable[Any], existing_stats: Stats, collector_num: int = None, total_collectors: int = None) -> Stats:
         """Collect birth statistics."""
-        stats = Stats()
+        stats = existing_stats
 
         # Convert to list for progress tracking
-        people_list = list(people)
+        people_list = self._as_list(people)
         total_people = len(people_list)
 
         # Build collector prefix
@@ -93,7 +93,7 @@ class BirthsCollector(StatisticsCollector):
                 self._report_step(plus_step=100)
             # Get birth date details
             birth_date = self._get_birth_date(person)
-            birth_year = self._get_birth_year(person)
+            birth_year = year_num(birth_date) if birth_date else None
 
             if birth_year:
                 birth_years.append(birth_year)
@@ -162,12 +162,14 @@ class BirthsCollector(StatisticsCollector):
         # Birth years range
         if birth_years:
             # Filter out implausibly early dates using configured threshold
-            credible_years = [y for y in birth_years if y >= self.earliest_credible_birth_year]
-
-            if credible_years:
-                stats.add_value('births', 'earliest_birth_year', min(credible_years))
-            stats.add_value('births', 'latest_birth_year', max(birth_years))
-            stats.add_value('births', 'birth_year_span', max(birth_years) - min(birth_years))
+            threshold = self.earliest_credible_birth_year
+            earliest_credible = min((y for y in birth_years if y >= threshold), default=None)
+            latest_year = max(birth_years)
+
+            if earliest_credible is not None:
+                stats.add_value('births', 'earliest_birth_year', earliest_credible)
+            stats.add_value('births', 'latest_birth_year', latest_year)
+            stats.add_value('births', 'birth_year_span', latest_year - min(birth_years))
 
         # Zodiac signs statistics
         if zodiac_signs:
@@ -30,14 +30,14 @@ class ChildrenCollector(StatisticsCollector):
     """
     collector_id: str = "children"
 
-    def collect(self, people: Iterable[Any], existing_stats: Stats, collector_num: int = None, total_collectors: int = None) -> Stats:
-        """Collect children statistics."""
-        stats = Stats()
-
+    def collect(self, people: Iterable[Any], existing_stats: Stats, collector_num: int = None, total_collectors: int = None) -> Optional[Stats]:
+        """Collect children statistics, or return None if nobody has children."""
         # Convert to list and dict for lookups
-        people_list = list(people)
+        people_list = self._as_list(people)
         total_people = len(people_list)
         people_dict = {self._get_id(p): p for p in people_list}
+        # Resolve each birth year once; children and siblings are looked up repeatedly
+        birth_years_by_id = {pid: self._get_birth_year(p) for pid, p in people_dict.items()}
 
         # Build collector prefix
         prefix = f"Statistics ({collector_num}/{total_collectors}): " if collector_num and total_collectors else "Statistics: "
@@ -77,6 +77,12 @@ class ChildrenCollector(StatisticsCollector):
         # Track processed families to avoid duplicates
         processed_families = set()
 
+        # Bind per-person helpers to locals for the hot loop
+        get_id = self._get_id
+        get_children = self._get_children
+        get_sex = self._get_sex
+        get_name = self._get_name
+
         for idx, person in enumerate(people_list, 1):
             # Check for stop request on every iteration
             if self._stop_requested("Children collection stopped"):
@@ -85,17 +91,17 @@ class ChildrenCollector(StatisticsCollector):
             if idx % 100 == 0:
                 self._report_step(plus_step=100)
 
-            person_id = self._get_id(person)
+            person_id = get_id(person)
 
             # Get children
-            children_ids = self._get_children(person)
+            children_ids = get_children(person)
             if not children_ids:
                 continue
 
             num_children = len(children_ids)
             children_per_person[person_id] = num_children
 
-            sex = self._get_sex(person)
+            sex = get_sex(person)
             if sex == 'M':
                 children_per_person_male[person_id] = num_children
             elif sex == 'F':
@@ -104,15 +110,13 @@ class ChildrenCollector(StatisticsCollector):
             # Get children birth years for age analysis
             children_birth_years = []
             for child_id in children_ids:
-                child = people_dict.get(child_id)
-                if child:
-                    child_birth_year = self._get_birth_year(child)
-                    if child_birth_year:
-                        children_birth_years.append(child_birth_year)
+                child_birth_year = birth_years_by_id.get(child_id)
+                if child_birth_year:
+                    children_birth_years.append(child_birth_year)
 
             # Calculate age when having children
             if children_birth_years:
-                birth_year = self._get_birth_year(person)
+                birth_year = birth_years_by_id.get(person_id)
                 if birth_year:
                     children_birth_years_sorted = sorted(children_birth_years)
                     first_child_year = children_birth_years_sorted[0]
@@ -147,7 +151,7 @@ class ChildrenCollector(StatisticsCollector):
                     sibling_birth_years = []
 
                     for sibling in siblings:
-                        birth_year = self._get_birth_year(sibling)
+                        birth_year = birth_years_by_id.get(get_id(sibling))
                         if birth_year:
                             sibling_birth_years.append(birth_year)
 
@@ -157,15 +161,15 @@ class ChildrenCollector(StatisticsCollector):
                     # Get parent names
                     father = people_dict.get(str(father_id))
                     mother = people_dict.get(str(mother_id))
-                    father_name = self._get_name(father) if father else 'Unknown'
-                    mother_name = self._get_name(mother) if mother else 'Unknown'
+                    father_name = get_name(father) if father else 'Unknown'
+                    mother_name = get_name(mother) if mother else 'Unknown'
 
                     families_with_info.append((family_size, father_name, mother_name))
 
                     # Calculate sibling age gaps
                     if len(sibling_birth_years) >= 2:
                         sorted_years = sorted(sibling_birth_years)
-                        gaps = [sorted_years[i+1] - sorted_years[i] for i in range(len(sorted_years)-1)]
+                        gaps = [later - earlier for earlier, later in zip(sorted_years, sorted_years[1:])]
 
                         for gap in gaps:
                             if gap > 0:
@@ -176,20 +180,26 @@ class ChildrenCollector(StatisticsCollector):
                             min_gap = min(gaps)
                             families_with_gaps.append((max_gap, min_gap, father_name, mother_name))
 
+        # Every statistic below needs at least one person with children
+        if not children_per_person:
+            logger.info("Children: No family data")
+            return None
+
+        stats = existing_stats
+
         # Children per person statistics
-        if children_per_person:
-            children_counts = Counter(children_per_person.values())
-            stats.add_value('children', 'children_per_person_distribution', dict(sorted(children_counts.items())))
-
-            # People with most children
-            max_children = max(children_per_person.values())
-            most_children = [(self._get_name(people_dict[pid]), count)
-                           for pid, count in children_per_person.items() if count == max_children]
-            if most_children:
-                stats.add_value('children', 'most_children', max_children)
-                stats.add_value('children', 'people_with_most_children', [
-                    {'name': name, 'children': count} for name, count in most_children[:10]
-                ])
+        children_counts = Counter(children_per_person.values())
+        stats.add_value('children', 'children_per_person_distribution', dict(sorted(children_counts.items())))
+
+        # People with most children
+        max_children = max(children_per_person.values())
+        most_children = [(self._get_name(people_dict[pid]), count)
+                       for pid, count in children_per_person.items() if count == max_children]
+        if most_children:
+            stats.add_value('children', 'most_children', max_children)
+            stats.add_value('children', 'people_with_most_children', [
+                {'name': name, 'children': count} for name, count in most_children[:10]
+            ])
 
         if children_per_person_male:
             max_male = max(children_per_person_male.values())
@@ -34,10 +34,10 @@ class DemographicsCollector(StatisticsCollector):
 
     def collect(self, people: Iterable[Any], existing_stats: Stats, collector_num: int = None, total_collectors: int = None) -> Stats:
         """Collect demographic statistics."""
-        stats = Stats()
+        stats = existing_stats
 
         # Convert to list for counting and progress tracking
-        people_list = list(people)
+        people_list = self._as_list(people)
         total_people = len(people_list)
 
         total_count = 0
@@ -33,10 +33,10 @@ class DivorceCollector(StatisticsCollector):
 
     def collect(self, people: Iterable[Any], existing_stats: Stats, collector_num: int = None, total_collectors: int = None) -> Stats:
         """Collect divorce statistics."""
-        stats = Stats()
+        stats = existing_stats
 
         # Convert to list for processing
-        people_list = list(people)
+        people_list = self._as_list(people)
         total_people = len(people_list)
 
         # Build people dictionary for O(1) lookups
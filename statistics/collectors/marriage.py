@@ -3,9 +3,10 @@ Marriage statistics collector.
 """
 from __future__ import annotations
 
-from collections import Counter, defaultdict
+from collections import Counter
 from dataclasses import dataclass
 from datetime import date as _date
+import heapq
 import logging
 from typing import Any, Iterable, Optional, Dict, List
 
@@ -33,10 +34,10 @@ class MarriageCollector(StatisticsCollector):
 
     def collect(self, people: Iterable[Any], existing_stats: Stats, collector_num: int = None, total_collectors: int = None) -> Stats:
         """Collect marriage statistics."""
-        stats = Stats()
+        stats = existing_stats
 
         # Convert to list and dict for lookups
-        people_list = list(people)
+        people_list = self._as_list(people)
         total_people = len(people_list)
         people_dict = {self._get_id(p): p for p in people_list}
 
@@ -46,14 +47,14 @@ class MarriageCollector(StatisticsCollector):
         # Set up progress tracking
         self._report_step(info=f"{prefix}Analyzing marriages", target=total_people, reset_counter=True, plus_step=0)
 
-        # Marriage counts
-        marriage_counts = Counter()
-        marriages_by_person = defaultdict(int)
+        # Marriage counts per person (distribution is built from these after the walk)
+        marriages_by_person: Dict[str, int] = {}
 
         # Marriage ages
         marriage_ages_male = []
         marriage_ages_female = []
         all_marriage_ages = []
+        marriage_ages_by_sex = {'M': marriage_ages_male, 'F': marriage_ages_female}
 
         # Marriage durations
         marriage_durations = []
@@ -69,9 +70,21 @@ class MarriageCollector(StatisticsCollector):
         marriage_decades = Counter()
         marriage_centuries = Counter()
 
-        # Track processed marriages to avoid duplicates
+        # Track processed marriages to avoid duplicates: the same Marriage
+        # object is attached to both partners, so key on object identity
         processed_marriages = set()
 
+        # Bind per-person helpers to locals for the hot loop
+        get_id = self._get_id
+        get_birth_year = self._get_birth_year
+        get_death_year = self._get_death_year
+        get_sex = self._get_sex
+        get_name = self._get_name
+        get_marriages = self._get_marriages
+        get_marriage_event = self._get_marriage_event
+        get_marriage_year = self._get_marriage_year
+        get_partner = self._get_partner
+
         for idx, person in enumerate(people_list, 1):
             # Check for stop request on every iteration
             if self._stop_requested("Marriage collection stopped"):
@@ -80,27 +93,29 @@ class MarriageCollector(StatisticsCollector):
             if idx % 100 == 0:
                 self._report_step(plus_step=100)
 
-            person_id = self._get_id(person)
-            birth_year = self._get_birth_year(person)
-            death_year = self._get_death_year(person)
-            sex = self._get_sex(person)
-            name = self._get_name(person)
+            person_id = get_id(person)
+            birth_year = get_birth_year(person)
+            death_year = get_death_year(person)
+            sex = get_sex(person)
+            name = get_name(person)
 
             # Get marriage events
-            marriages = self._get_marriages(person)
+            marriages = get_marriages(person)
             if not marriages:
                 continue
 
             marriage_count = len(marriages)
             marriages_by_person[person_id] = marriage_count
-            marriage_counts[marriage_count] += 1
+
+            # Resolve the gender bucket once per person rather than per marriage
+            sex_marriage_ages = marriage_ages_by_sex.get(sex)
 
             for marriage in marriages:
                 # Get marriage event details
-                marriage_event = self._get_marriage_event(marriage)
-                marriage_year = self._get_marriage_year(marriage_event) if marriage_event else None
+                marriage_event = get_marriage_event(marriage)
+                marriage_year = get_marriage_year(marriage_event) if marriage_event else None
 
-                # Track marriage years
+                # Track marriage years (per partner, so before de-duplication)
                 if marriage_year:
                     marriage_years.append(marriage_year)
                     decade = (marriage_year // 10) * 10
@@ -108,20 +123,18 @@ class MarriageCollector(StatisticsCollector):
                     century = ((marriage_year - 1) // 100) + 1
                     marriage_centuries[century] += 1
 
-                # Calculate age at marriage
+                # Calculate age at marriage (per person, so before de-duplication)
                 if birth_year and marriage_year:
                     age_at_marriage = marriage_year - birth_year
                     if 0 <= age_at_marriage <= 100:
                         all_marriage_ages.append(age_at_marriage)
-                        if sex == 'M':
-                            marriage_ages_male.append(age_at_marriage)
-                        elif sex == 'F':
-                            marriage_ages_female.append(age_at_marriage)
+                        if sex_marriage_ages is not None:
+                            sex_marriage_ages.append(age_at_marriage)
 
                 # Get partner and calculate age difference
-                partner = self._get_partner(marriage, person)
+                partner = get_partner(marriage, person)
                 if partner:
-                    partner_id = self._get_id(partner)
+                    partner_id = get_id(partner)
 
                     # Create unique marriage ID to avoid duplicates
                     marriage_id = tuple(sorted([person_id, partner_id]))
@@ -129,10 +142,10 @@ class MarriageCollector(StatisticsCollector):
                         continue
                     processed_marriages.add(marriage_id)
 
-                    partner_birth_year = self._get_birth_year(partner)
-                    partner_death_year = self._get_death_year(partner)
-                    partner_sex = self._get_sex(partner)
-                    partner_name = self._get_name(partner)
+                    partner_birth_year = get_birth_year(partner)
+                    partner_death_year = get_death_year(partner)
+                    partner_sex = get_sex(partner)
+                    partner_name = get_name(partner)
 
                     # Age difference
                     if birth_year and partner_birth_year:
@@ -195,7 +208,7 @@ class MarriageCollector(StatisticsCollector):
         # Total marriages statistics
         total_people = len(people_list)
         people_with_marriages = len(marriages_by_person)
-        total_marriages = sum(marriage_counts.values())
+        marriage_counts = Counter(marriages_by_person.values())
 
         stats.add_value('marriage', 'total_people', total_people)
         stats.add_value('marriage', 'people_with_marriages', people_with_marriages)
@@ -238,16 +251,16 @@ class MarriageCollector(StatisticsCollector):
             stats.add_value('marriage', 'shortest_marriage_duration', min(marriage_durations))
             stats.add_value('marriage', 'longest_marriage_duration', max(marriage_durations))
 
-            # Longest marriages
-            longest = sorted(marriage_durations_with_info, key=lambda x: x[0], reverse=True)[:10]
+            # Longest marriages (top-10 selection instead of a full sort)
+            longest = heapq.nlargest(10, marriage_durations_with_info, key=lambda x: x[0])
             stats.add_value('marriage', 'longest_marriages', [
                 {'duration': dur, 'person1': p1, 'person2': p2} for dur, p1, p2 in longest
             ])
 
             # Shortest marriages (excluding very short ones < 1 year)
-            valid_short = [(d, p1, p2) for d, p1, p2 in marriage_durations_with_info if d >= 1]
-            if valid_short:
-                shortest = sorted(valid_short, key=lambda x: x[0])[:10]
+            shortest = heapq.nsmallest(10, (info for info in marriage_durations_with_info if info[0] >= 1),
+                                       key=lambda x: x[0])
+            if shortest:
                 stats.add_value('marriage', 'shortest_marriages', [
                     {'duration': dur, 'person1': p1, 'person2': p2} for dur, p1, p2 in shortest
                 ])
@@ -259,12 +272,12 @@ class MarriageCollector(StatisticsCollector):
             stats.add_value('marriage', 'max_age_difference', max(age_differences))
 
         if husband_older_cases:
-            sorted_cases = sorted(husband_older_cases, key=lambda x: x['age_difference'], reverse=True)
-            stats.add_value('marriage', 'husband_much_older_cases', sorted_cases[:10])
+            top_cases = heapq.nlargest(10, husband_older_cases, key=lambda x: x['age_difference'])
+            stats.add_value('marriage', 'husband_much_older_cases', top_cases)
 
         if wife_older_cases:
-            sorted_cases = sorted(wife_older_cases, key=lambda x: x['age_difference'], reverse=True)
-            stats.add_value('marriage', 'wife_much_older_cases', sorted_cases[:10])
+            top_cases = heapq.nlargest(10, wife_older_cases, key=lambda x: x['age_difference'])
+            stats.add_value('marriage', 'wife_much_older_cases', top_cases)
 
         # Marriage trends over time
         if marriage_decades:
@@ -30,10 +30,10 @@ class NamesCollector(StatisticsCollector):
 
     def collect(self, people: Iterable[Any], existing_stats: Stats, collector_num: int = None, total_collectors: int = None) -> Stats:
         """Collect name statistics."""
-        stats = Stats()
+        stats = existing_stats
 
         # Convert to list for counting and progress tracking
-        people_list = list(people)
+        people_list = self._as_list(people)
         total_people = len(people_list)
 
         first_names = []
@@ -38,10 +38,10 @@ class RelationshipPathCollector(StatisticsCollector):
 
     def collect(self, people: Iterable[Any], existing_stats: Stats, collector_num: int = None, total_collectors: int = None) -> Stats:
         """Collect relationship path statistics."""
-        stats = Stats()
+        stats = existing_stats
 
         # Convert to list and create lookup
-        people_list = list(people)
+        people_list = self._as_list(people)
         if not people_list:
             return stats
 
@@ -33,12 +33,11 @@ class RelationshipStatusCollector(StatisticsCollector):
 
     def collect(self, people: Iterable[Any], existing_stats: Stats, collector_num: int = None, total_collectors: int = None) -> Stats:
         """Collect relationship status statistics."""
-        stats = Stats()
+        stats = existing_stats
 
-        # Convert to list and dict for lookups
-        people_list = list(people)
+        # Convert to list for progress tracking
+        people_list = self._as_list(people)
         total_people = len(people_list)
-        people_dict = {self._get_id(p): p for p in people_list}
 
         # Build collector prefix
         prefix = f"Statistics ({collector_num}/{total_collectors}): " if collector_num and total_collectors else "Statistics: "
@@ -51,6 +50,7 @@ class RelationshipStatusCollector(StatisticsCollector):
         ever_married = 0
         currently_married_living = 0  # Living and has living spouse
         widowed = 0
+        living_people = 0
 
         # By gender
         status_by_gender = {
@@ -65,6 +65,14 @@ class RelationshipStatusCollector(StatisticsCollector):
 
         current_year = 2026  # Could use datetime.date.today().year
 
+        # Bind per-person helpers to locals for the hot loop
+        get_sex = self._get_sex
+        get_birth_year = self._get_birth_year
+        get_death_year = self._get_death_year
+        get_marriages = self._get_marriages
+        get_partner = self._get_partner
+        get_age_group = self._get_age_group
+
         for idx, person in enumerate(people_list, 1):
             # Check for stop request on every iteration
             if self._stop_requested("Relationship status collection stopped"):
@@ -73,30 +81,32 @@ class RelationshipStatusCollector(StatisticsCollector):
             if idx % 100 == 0:
                 self._report_step(plus_step=100)
 
-            person_id = self._get_id(person)
-            sex = self._get_sex(person)
+            sex = get_sex(person)
             sex_key = sex if sex in ['M', 'F'] else 'Unknown'
-            birth_year = self._get_birth_year(person)
-            death_year = self._get_death_year(person)
+            gender_status = status_by_gender[sex_key]
+            birth_year = get_birth_year(person)
+            death_year = get_death_year(person)
             is_living = death_year is None
+            if is_living:
+                living_people += 1
 
             # Get marriages
-            marriages = self._get_marriages(person)
+            marriages = get_marriages(person)
             has_marriage = len(marriages) > 0
 
             if not has_marriage:
                 never_married += 1
-                status_by_gender[sex_key]['never_married'] += 1
+                gender_status['never_married'] += 1
 
                 # Add to age group if living
                 if is_living and birth_year:
                     age = current_year - birth_year
-                    age_group = self._get_age_group(age)
+                    age_group = get_age_group(age)
                     if age_group:
                         status_by_age[age_group]['never_married'] += 1
             else:
                 ever_married += 1
-                status_by_gender[sex_key]['ever_married'] += 1
+                gender_status['ever_married'] += 1
 
                 # Check if currently married (for living people)
                 if is_living:
@@ -104,9 +114,9 @@ class RelationshipStatusCollector(StatisticsCollector):
                     all_spouses_deceased = True
 
                     for marriage in marriages:
-                        partner = self._get_partner(marriage, person)
+                        partner = get_partner(marriage, person)
                         if partner:
-                            partner_death_year = self._get_death_year(partner)
+                            partner_death_year = get_death_year(partner)
                             if partner_death_year is None:
                                 has_living_spouse = True
                                 all_spouses_deceased = False
@@ -114,20 +124,20 @@ class RelationshipStatusCollector(StatisticsCollector):
 
                     if has_living_spouse:
                         currently_married_living += 1
-                        status_by_gender[sex_key]['currently_married'] += 1
+                        gender_status['currently_married'] += 1
 
                         if birth_year:
                             age = current_year - birth_year
-                            age_group = self._get_age_group(age)
+                            age_group = get_age_group(age)
                             if age_group:
                                 status_by_age[age_group]['married'] += 1
                     elif all_spouses_deceased:
                         widowed += 1
-                        status_by_gender[sex_key]['widowed'] += 1
+                        gender_status['widowed'] += 1
 
                         if birth_year:
                             age = current_year - birth_year
-                            age_group = self._get_age_group(age)
+                            age_group = get_age_group(age)
                             if age_group:
                                 status_by_age[age_group]['widowed'] += 1
                 else:
@@ -135,16 +145,16 @@ class RelationshipStatusCollector(StatisticsCollector):
                     if death_year:
                         was_widowed = False
                         for marriage in marriages:
-                            partner = self._get_partner(marriage, person)
+                            partner = get_partner(marriage, person)
                             if partner:
-                                partner_death_year = self._get_death_year(partner)
+                                partner_death_year = get_death_year(partner)
                                 if partner_death_year and partner_death_year < death_year:
                                     was_widowed = True
                                     break
 
                         if was_widowed:
                             widowed += 1
-                            status_by_gender[sex_key]['widowed'] += 1
+                            gender_status['widowed'] += 1
 
         total_people = len(people_list)
 
@@ -172,7 +182,6 @@ class RelationshipStatusCollector(StatisticsCollector):
             stats.add_value('relationship_status', 'status_by_age_group', filtered_age_status)
 
         # Additional insights
-        living_people = sum(1 for p in people_list if self._get_death_year(p) is None)
         if living_people > 0:
             stats.add_value('relationship_status', 'living_people', living_people)
             stats.add_value('relationship_status', 'marriage_rate_among_living',
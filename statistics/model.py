@@ -37,9 +37,12 @@ class Stats:
     def merge(self, other: Stats) -> None:
         """Merge another Stats object into this one."""
         for category, values in other.categories.items():
-            if category not in self.categories:
-                self.categories[category] = {}
-            self.categories[category].update(values)
+            existing = self.categories.get(category)
+            if existing is None:
+                # Fast path: new category, take a shallow copy in one C-level call
+                self.categories[category] = dict(values)
+            else:
+                existing.update(values)
     
     def to_dict(self) -> Dict[str, Dict[str, StatValue]]:
         """Convert to a plain dictionary."""
@@ -3,6 +3,8 @@ Pipeline for running statistics collectors.
 """
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+import copy
 from dataclasses import dataclass, field, fields
 import logging
 from pathlib import Path
@@ -15,25 +17,46 @@ from geo_gedcom.statistics.model import Stats
 logger = logging.getLogger(__name__)
 
 
-@dataclass
 class StatisticsConfig:
     """
     Configuration for statistics collection.
     
+    A plain slotted class rather than a dataclass: it is consulted for every
+    collector on every run, so attribute access avoids a per-instance __dict__.
+    
     Attributes:
         collectors: Dict of collector_id -> enabled status
         statistics_options: Dict of option_name -> value for statistics collectors
         config_file: Path to YAML config file (optional)
     """
-    collectors: Dict[str, bool] = field(default_factory=dict)
-    statistics_options: Dict[str, Any] = field(default_factory=dict)
-    config_file: Optional[Path] = None
+    __slots__ = ['collectors', 'statistics_options', 'config_file']
     
-    def __post_init__(self) -> None:
-        """Load configuration from file if config_file is specified and exists."""
+    def __init__(
+        self,
+        collectors: Optional[Dict[str, bool]] = None,
+        statistics_options: Optional[Dict[str, Any]] = None,
+        config_file: Optional[Path] = None
+    ) -> None:
+        """
+        Initialize configuration, loading from file if config_file is specified and exists.
+        
+        Args:
+            collectors: Dict of collector_id -> enabled status
+            statistics_options: Dict of option_name -> value for statistics collectors
+            config_file: Path to YAML config file (optional)
+        """
+        self.collectors: Dict[str, bool] = collectors if collectors is not None else {}
+        self.statistics_options: Dict[str, Any] = statistics_options if statistics_options is not None else {}
+        self.config_file: Optional[Path] = config_file
+        
         if self.config_file and Path(self.config_file).exists():
             self._load_from_file()
     
+    def __repr__(self) -> str:
+        """Return a detailed string representation for debugging."""
+        return (f"StatisticsConfig(collectors={self.collectors!r}, "
+                f"statistics_options={self.statistics_options!r}, config_file={self.config_file!r})")
+    
     def _load_from_file(self) -> None:
         """
         Load configuration from YAML file.
@@ -123,10 +146,19 @@ class StatisticsPipeline:
         collectors: List of collector instances to run
         config: Configuration for the pipeline
         app_hooks: Optional application hooks for progress reporting
+        parallel: Run enabled collectors concurrently in a thread pool
+            (each into its own Stats, merged in collector order afterwards)
+        max_workers: Thread pool size when parallel is True (None = executor default)
+        collectors_by_type: Index of collector class -> collector instance
     """
     collectors: List[StatisticsCollector] = field(default_factory=list)
     config: StatisticsConfig = field(default_factory=StatisticsConfig)
     app_hooks: Optional[Any] = field(default=None)
+    parallel: bool = False
+    max_workers: Optional[int] = None
+    collectors_by_type: Dict[Type[StatisticsCollector], StatisticsCollector] = field(
+        default_factory=dict, init=False, repr=False
+    )
     
     def __post_init__(self) -> None:
         """
@@ -137,6 +169,19 @@ class StatisticsPipeline:
         """
         if not self.collectors:
             self._load_collectors_from_registry()
+        self.collectors_by_type = {type(c): c for c in self.collectors}
+    
+    def get_collector(self, collector_cls: Type[StatisticsCollector]) -> Optional[StatisticsCollector]:
+        """
+        Get the pipeline's collector instance of the given class.
+        
+        Args:
+            collector_cls: Collector class to look up (exact type, not subclasses)
+            
+        Returns:
+            The collector instance, or None if the pipeline has none of that class
+        """
+        return self.collectors_by_type.get(collector_cls)
     
     def _load_collectors_from_registry(self) -> None:
         """
@@ -189,6 +234,9 @@ class StatisticsPipeline:
         total_collectors = len(enabled_collectors)
         self._report_step(info="Collecting statistics", target=total_collectors, reset_counter=True, plus_step=0)
         
+        if self.parallel:
+            return self._run_parallel(people_list, enabled_collectors, stats)
+        
         collector_num = 0
         for idx, collector in enumerate(self.collectors):
             if not collector.enabled:
@@ -205,7 +253,10 @@ class StatisticsPipeline:
             try:
                 logger.debug(f"Running collector: {collector.collector_id}")
                 collector_stats = collector.collect(people_list, stats, collector_num, total_collectors)
-                stats.merge(collector_stats)
+                # Built-in collectors write into stats in place; only merge a
+                # separate Stats object returned by a custom collector
+                if collector_stats is not None and collector_stats is not stats:
+                    stats.merge(collector_stats)
                 
                 # Report progress after each collector
                 self._report_step(plus_step=1)
@@ -214,6 +265,51 @@ class StatisticsPipeline:
         
         return stats
     
+    def _run_parallel(self, people_list: List[Any], enabled_collectors: List[StatisticsCollector], stats: Stats) -> Stats:
+        """
+        Run enabled collectors concurrently, each into its own Stats. (Private method)
+        
+        Collectors only read the shared people list, so they are independent;
+        results are merged into stats in collector order so the output matches
+        a sequential run. App hooks are not thread-safe in general, so workers
+        run copies of the collectors with app_hooks detached; progress is
+        reported and stop requests are checked only on the calling thread, as
+        each collector's result is collected.
+        
+        Args:
+            people_list: People to analyze
+            enabled_collectors: Collectors to run, in order
+            stats: Stats object to merge results into
+            
+        Returns:
+            stats with all collected values merged in
+        """
+        total_collectors = len(enabled_collectors)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = []
+            for collector_num, collector in enumerate(enabled_collectors, 1):
+                worker_collector = copy.copy(collector)
+                worker_collector.app_hooks = None
+                logger.debug(f"Submitting collector: {collector.collector_id}")
+                futures.append((collector, executor.submit(
+                    worker_collector.collect, people_list, Stats(), collector_num, total_collectors)))
+            
+            for idx, (collector, future) in enumerate(futures):
+                if self._stop_requested("Statistics collection stopped by user"):
+                    logger.info(f"Statistics stopped after {idx} collectors")
+                    for _, pending in futures[idx:]:
+                        pending.cancel()
+                    break
+                try:
+                    collector_stats = future.result()
+                    if collector_stats is not None:
+                        stats.merge(collector_stats)
+                    self._report_step(plus_step=1)
+                except Exception as e:
+                    logger.error(f"Error in collector {collector.collector_id}: {e}", exc_info=True)
+        
+        return stats
+    
     def _report_step(self, info: str = "", target: Optional[int] = None, reset_counter: bool = False, plus_step: int = 0) -> None:
         """
         Report a step via app hooks if available. (Private method)
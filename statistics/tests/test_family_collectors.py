@@ -20,6 +20,8 @@ from geo_gedcom.statistics.model import Stats
 
 class MockDate:
     """Mock GedcomDate with year_num property."""
+    __slots__ = ['year_num', 'year']
+
     def __init__(self, year):
         self.year_num = year
         self.year = year
@@ -27,12 +29,16 @@ class MockDate:
 
 class MockEvent:
     """Mock LifeEvent with date."""
+    __slots__ = ['date']
+
     def __init__(self, year=None):
         self.date = MockDate(year) if year is not None else None
 
 
 class MockMarriage:
     """Mock Marriage object."""
+    __slots__ = ['people_list', 'event', 'divorce']
+
     def __init__(self, people_list, event_year=None, divorce_year=None):
         self.people_list = people_list
         self.event = MockEvent(event_year) if event_year is not None else None
@@ -40,7 +46,7 @@ class MockMarriage:
     
     def partner(self, person):
         """Return the other partner."""
-        partners = [p for p in self.people_list if p != person]
+        partners = [p for p in self.people_list if p is not person]
         return partners[0] if partners else None
     
     def get_event(self, event_type):
@@ -52,10 +58,15 @@ class MockMarriage:
 
 class MockPerson:
     """Mock Person for testing."""
+    __slots__ = ['xref_id', '_birth_year', '_death_year', '_birth_event', '_death_event',
+                 'sex', 'name', 'children', 'father', 'mother', '_marriages']
+
     def __init__(self, xref_id='I1', birth_year=None, death_year=None, sex=None, name='Test Person'):
         self.xref_id = xref_id
         self._birth_year = birth_year
         self._death_year = death_year
+        self._birth_event = MockEvent(birth_year) if birth_year else None
+        self._death_event = MockEvent(death_year) if death_year else None
         self.sex = sex
         self.name = name
         self.children = []
@@ -75,10 +86,10 @@ class MockPerson:
         return []
     
     def get_event(self, event_type):
-        if event_type == 'birth' and self._birth_year:
-            return MockEvent(self._birth_year)
-        elif event_type == 'death' and self._death_year:
-            return MockEvent(self._death_year)
+        if event_type == 'birth':
+            return self._birth_event
+        elif event_type == 'death':
+            return self._death_event
         return None
 
 
@@ -101,6 +112,35 @@ def test_marriage_collector_basic():
     assert marriage_stats['total_marriages_recorded'] == 1
 
 
+def test_marriage_collector_decades_count_each_partner():
+    """Test decade/century counts keep their per-partner counting."""
+    husband = MockPerson('I1', 1950, None, 'M', 'John')
+    wife = MockPerson('I2', 1955, None, 'F', 'Jane')
+    husband.add_marriage(wife, 1975)
+    
+    marriage_stats = MarriageCollector().collect([husband, wife], Stats()).get_category('marriage')
+    
+    assert marriage_stats['total_marriages_recorded'] == 1
+    assert marriage_stats['marriages_by_decade'] == {'1970s': 2}
+    assert marriage_stats['marriages_by_century'] == {'20th century': 2}
+
+
+def test_marriage_collector_counts_each_couple_once():
+    """Test partnerless marriages and repeated records for a couple are not counted."""
+    husband = MockPerson('I1', 1950, None, 'M', 'John')
+    wife = MockPerson('I2', 1955, None, 'F', 'Jane')
+    widow = MockPerson('I3', 1960, None, 'F', 'Mary')
+    husband.add_marriage(wife, 1975)
+    husband.add_marriage(wife, 1980)  # Duplicate MARR record for the same couple
+    widow._marriages.append(MockMarriage([widow], 1985))  # Family with no partner
+    
+    marriage_stats = MarriageCollector().collect([husband, wife, widow], Stats()).get_category('marriage')
+    
+    assert marriage_stats['total_marriages_recorded'] == 1
+    assert marriage_stats['people_with_marriages'] == 3
+    assert marriage_stats['marriages_by_decade'] == {'1970s': 2, '1980s': 3}
+
+
 def test_marriage_collector_ages():
     """Test marriage age calculations."""
     husband = MockPerson('I1', 1950, None, 'M', 'John')
@@ -203,6 +243,15 @@ def test_children_collector_basic():
     assert children_stats['most_children'] == 2
 
 
+def test_children_collector_no_children_returns_none():
+    """Test ChildrenCollector returns None when nobody has children."""
+    people = [MockPerson('I1', 1950, None, 'M'), MockPerson('I2', 1952, None, 'F')]
+    
+    collector = ChildrenCollector()
+    
+    assert collector.collect(people, Stats()) is None
+
+
 def test_children_collector_ages():
     """Test age at having children."""
     father = MockPerson('I1', 1950, None, 'M', 'Father')
@@ -369,13 +418,10 @@ def test_integration_all_family_collectors():
     
     combined_stats = Stats()
     
-    marriage_stats = marriage_collector.collect(people, combined_stats)
-    children_stats = children_collector.collect(people, combined_stats)
-    status_stats = status_collector.collect(people, combined_stats)
-    
-    combined_stats.merge(marriage_stats)
-    combined_stats.merge(children_stats)
-    combined_stats.merge(status_stats)
+    # Collectors write into combined_stats in place
+    marriage_collector.collect(people, combined_stats)
+    children_collector.collect(people, combined_stats)
+    status_collector.collect(people, combined_stats)
     
     # Verify all categories exist
     assert 'marriage' in combined_stats.categories
@@ -63,6 +63,18 @@ class TestStats:
         assert stats1.get_value('events', 'birth_count') == 80
         assert stats1.get_value('geographic', 'unique_places') == 25
     
+    def test_merge_copies_new_categories(self):
+        """Test that merging a new category does not alias the source dict."""
+        stats1 = Stats()
+        stats2 = Stats()
+        stats2.add_value('geographic', 'unique_places', 25)
+        
+        stats1.merge(stats2)
+        stats1.add_value('geographic', 'countries', 3)
+        
+        assert stats2.get_value('geographic', 'countries') is None
+        assert stats1.get_value('geographic', 'unique_places') == 25
+    
     def test_to_dict(self):
         """Test converting to dictionary."""
         stats = Stats()
@@ -87,3 +99,16 @@ class TestStats:
         assert stats.get_value('demographics', 'total_people') == 100
         assert stats.get_value('demographics', 'living') == 60
         assert stats.get_value('events', 'birth_count') == 80
+    
+    def test_get_category_consistent_with_get_value_after_mutation(self):
+        """Test that a mutated category result never diverges from get_value()."""
+        stats = Stats()
+        stats.add_value('demographics', 'total_people', 100)
+        
+        category = stats.get_category('demographics')
+        category['total_people'] = 1
+        
+        assert stats.get_category('demographics')['total_people'] == stats.get_value('demographics', 'total_people')
+        
+        stats.categories['demographics']['living'] = 60
+        assert stats.get_category('demographics')['living'] == stats.get_value('demographics', 'living')
@@ -7,7 +7,7 @@ import pytest
 from dataclasses import dataclass
 from typing import Any, Iterable
 
-from geo_gedcom.statistics.base import StatisticsCollector, register_collector
+from geo_gedcom.statistics.base import StatisticsCollector, register_collector, get_collector_registry
 from geo_gedcom.statistics.model import Stats
 from geo_gedcom.statistics.pipeline import StatisticsPipeline, StatisticsConfig
 
@@ -19,9 +19,53 @@ class MockCollector(StatisticsCollector):
     collector_id: str = "mock_collector"
     
     def collect(self, people: Iterable[Any], existing_stats: Stats, collector_num: int = None, total_collectors: int = None) -> Stats:
-        stats = Stats()
-        stats.add_value('test', 'count', len(list(people)))
-        return stats
+        existing_stats.add_value('test', 'count', self._count_people(people))
+        return existing_stats
+
+
+@dataclass
+class EmptyCollector(StatisticsCollector):
+    """Mock collector that has nothing to contribute."""
+    collector_id: str = "empty_collector"
+    
+    def collect(self, people: Iterable[Any], existing_stats: Stats, collector_num: int = None, total_collectors: int = None) -> None:
+        return None
+
+
+class MockDate:
+    """Mock GedcomDate with year_num property."""
+    __slots__ = ['year_num', 'year', 'month', 'day']
+
+    def __init__(self, year, month=None, day=None):
+        self.year_num = year
+        self.year = year
+        self.month = month
+        self.day = day
+
+
+class MockEvent:
+    """Mock LifeEvent with date."""
+    __slots__ = ['date', 'place']
+
+    def __init__(self, year, month=None, day=None):
+        self.date = MockDate(year, month, day)
+        self.place = None
+
+
+class MockPerson:
+    """Mock Person with a name, sex and birth/death dates, for running the real collectors."""
+    __slots__ = ['name', 'sex', 'firstname', '_events']
+
+    def __init__(self, name, sex, birth_year, birth_month=None, birth_day=None, death_year=None):
+        self.name = name
+        self.sex = sex
+        self.firstname = name.split('/')[0].strip()
+        self._events = {'birth': MockEvent(birth_year, birth_month, birth_day)}
+        if death_year:
+            self._events['death'] = MockEvent(death_year)
+
+    def get_event(self, event_type):
+        return self._events.get(event_type)
 
 
 class TestStatisticsConfig:
@@ -55,6 +99,19 @@ class TestStatisticsConfig:
         assert config.is_enabled('other_collector') is True
 
 
+class TestRegisterCollector:
+    """Tests for the collector registry."""
+    
+    def test_register_collector_is_idempotent(self):
+        """Test that registering the same class twice leaves the registry unchanged."""
+        from geo_gedcom.statistics.collectors.births import BirthsCollector
+        
+        before = get_collector_registry()
+        
+        assert register_collector(BirthsCollector) is BirthsCollector
+        assert get_collector_registry() == before
+
+
 class TestStatisticsPipeline:
     """Tests for StatisticsPipeline class."""
     
@@ -73,6 +130,75 @@ class TestStatisticsPipeline:
         
         assert stats.get_value('test', 'count') == 3
     
+    def test_collector_counts_unsized_iterable(self, mock_person):
+        """Test that collectors can count a plain iterator without len()."""
+        people = iter([mock_person('I1', 'Person 1'), mock_person('I2', 'Person 2')])
+        
+        stats = MockCollector().collect(people, Stats())
+        
+        assert stats.get_value('test', 'count') == 2
+    
+    def test_pipeline_skips_collectors_returning_none(self, mock_person):
+        """Test that a collector returning None is skipped without error."""
+        people = [mock_person('I1', 'Person 1')]
+        
+        pipeline = StatisticsPipeline(collectors=[EmptyCollector(), MockCollector()])
+        
+        stats = pipeline.run(people)
+        
+        assert stats.get_value('test', 'count') == 1
+    
+    def test_parallel_run_matches_sequential(self):
+        """Test that a parallel run produces the same results as a sequential one."""
+        people = [
+            MockPerson('John /Smith/', 'M', 1900, death_year=1970),
+            MockPerson('Jane /Smith/', 'F', 1905, birth_month=3, birth_day=14),
+            MockPerson('Bob /Jones/', 'M', 1930),
+        ]
+        
+        sequential = StatisticsPipeline().run(people)
+        parallel = StatisticsPipeline(parallel=True, max_workers=4).run(people)
+        
+        assert parallel.to_dict() == sequential.to_dict()
+    
+    def test_parallel_run_calls_hooks_on_calling_thread(self):
+        """Test that a parallel run only calls app hooks from the calling thread."""
+        import threading
+        
+        class RecordingHooks:
+            def __init__(self):
+                self.threads = set()
+                self.steps = 0
+            
+            def report_step(self, info="", target=None, reset_counter=False, plus_step=0):
+                self.threads.add(threading.get_ident())
+                self.steps += plus_step
+            
+            def stop_requested(self):
+                self.threads.add(threading.get_ident())
+                return False
+        
+        hooks = RecordingHooks()
+        people = [MockPerson('John /Smith/', 'M', 1900, death_year=1970)] * 150
+        pipeline = StatisticsPipeline(app_hooks=hooks, parallel=True, max_workers=4)
+        stats = pipeline.run(people)
+        
+        assert hooks.threads == {threading.get_ident()}
+        assert hooks.steps == len([c for c in pipeline.collectors if c.enabled])
+        assert all(c.app_hooks is hooks for c in pipeline.collectors)
+        assert stats.to_dict() == StatisticsPipeline().run(people).to_dict()
+    
+    def test_parallel_run_stops_on_request(self, mock_person):
+        """Test that a stop request skips merging further collector results."""
+        class StopHooks:
+            def stop_requested(self):
+                return True
+        
+        pipeline = StatisticsPipeline(collectors=[MockCollector()], app_hooks=StopHooks(), parallel=True)
+        stats = pipeline.run([mock_person('I1', 'Person 1')])
+        
+        assert stats.get_value('test', 'count') is None
+    
     def test_pipeline_respects_enabled_flag(self, mock_person):
         """Test that disabled collectors are not run."""
         people = [mock_person('I1', 'Person 1')]
@@ -117,10 +243,7 @@ class TestStatisticsPipeline:
         pipeline = StatisticsPipeline(config=config)
         
         # Find the births collector and verify it has the custom threshold
-        births_collector = next(
-            (c for c in pipeline.collectors if isinstance(c, BirthsCollector)),
-            None
-        )
+        births_collector = pipeline.get_collector(BirthsCollector)
         assert births_collector is not None
         assert births_collector.earliest_credible_birth_year == 1500
         
@@ -13,10 +13,8 @@ from geo_gedcom.person import Person
 class TestStatistics:
     """Tests for Statistics wrapper class."""
     
-    def test_init_with_people(self, sample_people):
+    def test_init_with_people(self, stats):
         """Test initializing with people dictionary."""
-        stats = Statistics(people=sample_people)
-        
         assert stats.results is not None
         assert stats.get_value('demographics', 'total_people') == 3
     
@@ -27,10 +25,8 @@ class TestStatistics:
         assert stats.results is not None
         assert stats.get_value('demographics', 'total_people') == 2
     
-    def test_get_value(self, sample_people):
+    def test_get_value(self, stats):
         """Test get_value convenience method."""
-        stats = Statistics(people=sample_people)
-        
         total = stats.get_value('demographics', 'total_people')
         assert total == 3
         
@@ -38,18 +34,14 @@ class TestStatistics:
         missing = stats.get_value('demographics', 'nonexistent', default=0)
         assert missing == 0
     
-    def test_get_category(self, sample_people):
+    def test_get_category(self, stats):
         """Test get_category convenience method."""
-        stats = Statistics(people=sample_people)
-        
         demographics = stats.get_category('demographics')
         assert isinstance(demographics, dict)
         assert 'total_people' in demographics
     
-    def test_to_dict(self, sample_people):
+    def test_to_dict(self, stats):
         """Test to_dict export."""
-        stats = Statistics(people=sample_people)
-        
         data = stats.to_dict()
         assert isinstance(data, dict)
         assert 'demographics' in data
@@ -80,6 +72,15 @@ class TestStatistics:
         
         # Should still have demographics
         assert stats.get_value('demographics', 'total_people') == 3
+        
+        # Disabled collectors are switched off in the pipeline, the rest stay on
+        enabled = {c.collector_id: c.enabled for c in stats.pipeline.collectors}
+        assert enabled['demographics'] is True
+        assert enabled['event_completeness'] is False
+        assert enabled['geographic'] is False
+        assert enabled['gender'] is True
+        # (event_completeness writes the 'events' category)
+        assert stats.get_category('events') == {}
     
     def test_empty_initialization(self):
         """Test initialization with no people."""
@@ -91,21 +92,28 @@ class TestStatistics:
 
 # Fixtures
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_people():
-    """Create sample people dictionary."""
-    people = {}
-    for i in range(1, 4):
-        person = Person(xref_id=f"I{i}")
-        person.name = f"Person {i}"
-        people[f"I{i}"] = person
-    
-    return people
+    """Create sample people dictionary (built once per module; tests must not mutate it)."""
+    return {f"I{i}": _make_person(i) for i in range(1, 4)}
+
+
+def _make_person(i: int) -> Person:
+    """Create a named Person with xref_id I<i>."""
+    person = Person(xref_id=f"I{i}")
+    person.name = f"Person {i}"
+    return person
+
+
+@pytest.fixture(scope="module")
+def stats(sample_people):
+    """Statistics analyzed once over sample_people and shared by read-only tests."""
+    return Statistics(people=sample_people)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_gedcom_parser():
-    """Create a mock gedcom parser with people."""
+    """Create a mock gedcom parser with people (built once per module)."""
     class MockParser:
         def __init__(self):
             self.people = {
@@ -15,6 +15,8 @@ from geo_gedcom.statistics.model import Stats
 
 class MockDate:
     """Mock GedcomDate with year_num property."""
+    __slots__ = ['year_num', 'year']
+
     def __init__(self, year):
         self.year_num = year
         self.year = year
@@ -22,6 +24,8 @@ class MockDate:
 
 class MockEvent:
     """Mock LifeEvent with date and optional place."""
+    __slots__ = ['date', 'place']
+
     def __init__(self, year=None, place=None):
         self.date = MockDate(year) if year is not None else None
         self.place = place
@@ -29,42 +33,74 @@ class MockEvent:
 
 class MockPerson:
     """Mock Person for testing."""
+    __slots__ = ['sex', '_events']
+
+    # Other event types are dated at a fixed offset from birth (approximate age)
+    _EVENT_YEAR_OFFSETS = {
+        'burial': 25,
+        'baptism': 25,
+        'marriage': 25,
+        'christening': 25,
+        'residence': 25,
+    }
+
     def __init__(self, birth_year=None, death_year=None, sex=None, has_places=False):
-        self._birth_year = birth_year
-        self._death_year = death_year
         self.sex = sex
-        self._has_places = has_places
+        place = 'Test Place' if has_places else None
+        # Build every event up front so get_event is a single dict lookup
+        self._events = {}
+        if birth_year:
+            self._events['birth'] = MockEvent(birth_year, place)
+            for event_type, offset in self._EVENT_YEAR_OFFSETS.items():
+                self._events[event_type] = MockEvent(birth_year + offset, place)
+        if death_year:
+            self._events['death'] = MockEvent(death_year, place)
     
     def get_event(self, event_type):
-        place = 'Test Place' if self._has_places else None
-        
-        if event_type == 'birth' and self._birth_year:
-            return MockEvent(self._birth_year, place)
-        elif event_type == 'death' and self._death_year:
-            return MockEvent(self._death_year, place)
-        elif event_type in ['burial', 'baptism', 'marriage', 'christening', 'residence']:
-            # Return event with year if person has birth year
-            if self._birth_year:
-                year = self._birth_year + 25  # Approximate age
-                return MockEvent(year, place)
-        return None
-
-
-def test_longevity_collector_basic():
+        return self._events.get(event_type)
+
+
+# Longevity cohorts, built once at import and shared by the tests below
+LONGEVITY_BASIC_COHORT = (
+    MockPerson(1900, 1950, 'M'),  # Lived 50 years
+    MockPerson(1910, 1980, 'F'),  # Lived 70 years
+    MockPerson(1920, 2000, 'M'),  # Lived 80 years
+    MockPerson(1930, 1930, 'F'),  # Infant death (same year = 0 years)
+    MockPerson(1940, 1943, 'M'),  # Child death (3 years)
+)
+
+LONGEVITY_DECADE_COHORT = (
+    MockPerson(1900, 1960, 'M'),  # 1900s, lived 60 years
+    MockPerson(1905, 1965, 'F'),  # 1900s, lived 60 years
+    MockPerson(1950, 2020, 'M'),  # 1950s, lived 70 years
+    MockPerson(1955, 2025, 'F'),  # 1950s, lived 70 years
+)
+
+LONGEVITY_GENDER_COHORT = (
+    MockPerson(1900, 1950, 'M'),  # Male, 50 years
+    MockPerson(1900, 1960, 'M'),  # Male, 60 years
+    MockPerson(1900, 1970, 'F'),  # Female, 70 years
+    MockPerson(1900, 1980, 'F'),  # Female, 80 years
+)
+
+LONGEVITY_SURVIVAL_COHORT = (
+    MockPerson(1900, 1900, 'M'),  # Died at 0 (infant)
+    MockPerson(1900, 1903, 'F'),  # Died at 3 (child)
+    MockPerson(1900, 1920, 'M'),  # Died at 20
+    MockPerson(1900, 1965, 'F'),  # Died at 65
+    MockPerson(1900, 1985, 'M'),  # Died at 85
+)
+
+
+@pytest.fixture(scope="module")
+def longevity_stats(request):
+    """Longevity category for the cohort given via indirect parametrization, collected once per cohort."""
+    return LongevityCollector().collect(list(request.param), Stats()).get_category('longevity')
+
+
+@pytest.mark.parametrize("longevity_stats", [LONGEVITY_BASIC_COHORT], indirect=True, ids=['basic'])
+def test_longevity_collector_basic(longevity_stats):
     """Test LongevityCollector with basic data."""
-    people = [
-        MockPerson(1900, 1950, 'M'),  # Lived 50 years
-        MockPerson(1910, 1980, 'F'),  # Lived 70 years
-        MockPerson(1920, 2000, 'M'),  # Lived 80 years
-        MockPerson(1930, 1930, 'F'),  # Infant death (same year = 0 years)
-        MockPerson(1940, 1943, 'M'),  # Child death (3 years)
-    ]
-    
-    collector = LongevityCollector()
-    stats = collector.collect(people, Stats())
-    
-    longevity_stats = stats.get_category('longevity')
-    
     # Check basic statistics
     assert 'life_expectancy_by_birth_decade' in longevity_stats
     assert 'life_expectancy_by_birth_century' in longevity_stats
@@ -76,87 +112,52 @@ def test_longevity_collector_basic():
     assert 'survival_rates' in longevity_stats
 
 
-def test_longevity_collector_by_decade():
-    """Test life expectancy calculations by decade."""
-    people = [
-        MockPerson(1900, 1960, 'M'),  # 1900s, lived 60 years
-        MockPerson(1905, 1965, 'F'),  # 1900s, lived 60 years
-        MockPerson(1950, 2020, 'M'),  # 1950s, lived 70 years
-        MockPerson(1955, 2025, 'F'),  # 1950s, lived 70 years
-    ]
-    
-    collector = LongevityCollector()
-    stats = collector.collect(people, Stats())
-    
-    longevity_stats = stats.get_category('longevity')
-    le_by_decade = longevity_stats['life_expectancy_by_birth_decade']
-    
-    assert '1900s' in le_by_decade
-    assert '1950s' in le_by_decade
-    assert le_by_decade['1900s']['average'] == 60.0
-    assert le_by_decade['1950s']['average'] == 70.0
-    assert le_by_decade['1900s']['count'] == 2
-    assert le_by_decade['1950s']['count'] == 2
-
-
-def test_longevity_collector_by_gender():
-    """Test life expectancy by gender."""
-    people = [
-        MockPerson(1900, 1950, 'M'),  # Male, 50 years
-        MockPerson(1900, 1960, 'M'),  # Male, 60 years
-        MockPerson(1900, 1970, 'F'),  # Female, 70 years
-        MockPerson(1900, 1980, 'F'),  # Female, 80 years
-    ]
-    
-    collector = LongevityCollector()
-    stats = collector.collect(people, Stats())
-    
-    longevity_stats = stats.get_category('longevity')
-    le_by_gender = longevity_stats['life_expectancy_by_gender']
-    
-    assert 'M' in le_by_gender
-    assert 'F' in le_by_gender
-    assert le_by_gender['M']['average'] == 55.0
-    assert le_by_gender['F']['average'] == 75.0
+LONGEVITY_CASES = [
+    # 1900s births lived 60 years, 1950s births lived 70 years
+    ('by_decade', LONGEVITY_DECADE_COHORT, 'life_expectancy_by_birth_decade', {
+        '1900s': {'average': 60.0, 'count': 2},
+        '1950s': {'average': 70.0, 'count': 2},
+    }),
+    # Men lived 50 and 60 years, women 70 and 80
+    ('by_gender', LONGEVITY_GENDER_COHORT, 'life_expectancy_by_gender', {
+        'M': {'average': 55.0},
+        'F': {'average': 75.0},
+    }),
+    # Lifespans 0, 3, 20, 65 and 85 years
+    ('survival_rates', LONGEVITY_SURVIVAL_COHORT, 'survival_rates', {
+        'survived_to_age_5': {'count': 3, 'percentage': 60.0},
+        'survived_to_age_18': {'count': 3, 'percentage': 60.0},
+        'survived_to_age_65': {'count': 2, 'percentage': 40.0},
+        'survived_to_age_80': {'count': 1, 'percentage': 20.0},
+    }),
+]
 
 
-def test_longevity_collector_survival_rates():
-    """Test survival rate calculations."""
-    people = [
-        MockPerson(1900, 1900, 'M'),  # Died at 0 (infant)
-        MockPerson(1900, 1903, 'F'),  # Died at 3 (child)
-        MockPerson(1900, 1920, 'M'),  # Died at 20
-        MockPerson(1900, 1965, 'F'),  # Died at 65
-        MockPerson(1900, 1985, 'M'),  # Died at 85
-    ]
-    
-    collector = LongevityCollector()
-    stats = collector.collect(people, Stats())
-    
-    longevity_stats = stats.get_category('longevity')
-    survival_rates = longevity_stats['survival_rates']
-    
-    # 3 out of 5 survived to age 5 (60%)
-    assert survival_rates['survived_to_age_5']['count'] == 3
-    assert survival_rates['survived_to_age_5']['percentage'] == 60.0
-    
-    # 2 out of 5 survived to age 65 (40%)
-    assert survival_rates['survived_to_age_65']['count'] == 2
-    assert survival_rates['survived_to_age_65']['percentage'] == 40.0
+@pytest.mark.parametrize("longevity_stats,key,expected", [case[1:] for case in LONGEVITY_CASES],
+                         ids=[case[0] for case in LONGEVITY_CASES], indirect=["longevity_stats"])
+def test_longevity_collector_slices(longevity_stats, key, expected):
+    """Test life expectancy by decade and gender, and survival rates."""
+    result = longevity_stats[key]
+    
+    for group, values in expected.items():
+        for name, value in values.items():
+            assert result[group][name] == value, f"{key}[{group}][{name}]"
 
 
-def test_timeline_collector_basic():
-    """Test TimelineCollector with basic data."""
+@pytest.fixture(scope="module")
+def timeline_basic_stats():
+    """Timeline category for a three-person 1900-2000 cohort, collected once per module."""
     people = [
         MockPerson(1900, 1950),
         MockPerson(1920, 1980),
         MockPerson(1940, 2000),
     ]
-    
-    collector = TimelineCollector()
-    stats = collector.collect(people, Stats())
-    
-    timeline_stats = stats.get_category('timeline')
+    return TimelineCollector().collect(people, Stats()).get_category('timeline')
+
+
+def test_timeline_collector_basic(timeline_basic_stats):
+    """Test TimelineCollector with basic data."""
+    timeline_stats = timeline_basic_stats
     
     assert 'total_events_with_dates' in timeline_stats
     assert 'events_by_decade' in timeline_stats
@@ -166,6 +167,13 @@ def test_timeline_collector_basic():
     assert 'timeline_span_years' in timeline_stats
 
 
+def test_timeline_collector_span(timeline_basic_stats):
+    """Test timeline span from the earliest birth to the latest death."""
+    assert timeline_basic_stats['earliest_event_year'] == 1900
+    assert timeline_basic_stats['latest_event_year'] == 2000
+    assert timeline_basic_stats['timeline_span_years'] == 100
+
+
 def test_timeline_collector_event_density():
     """Test event density calculations."""
     people = [
@@ -267,11 +275,9 @@ def test_integration_longevity_timeline():
     
     combined_stats = Stats()
     
-    longevity_stats = longevity_collector.collect(people, combined_stats)
-    timeline_stats = timeline_collector.collect(people, combined_stats)
-    
-    combined_stats.merge(longevity_stats)
-    combined_stats.merge(timeline_stats)
+    # Collectors write into the shared Stats in place; no merge needed
+    assert longevity_collector.collect(people, combined_stats) is combined_stats
+    assert timeline_collector.collect(people, combined_stats) is combined_stats
     
     # Verify both categories exist
     assert 'longevity' in combined_stats.categories
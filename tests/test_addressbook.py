@@ -1,14 +1,17 @@
 import pytest
 from geo_gedcom.addressbook import AddressBook
 
-def test_addressbook_init():
+@pytest.fixture(params=[False, True], ids=["plain", "fuzzy"])
+def ab(request):
+    """AddressBook with exact and with fuzzy address matching."""
+    return AddressBook(fuzz=request.param)
+
+def test_addressbook_init(ab):
     """Test AddressBook can be instantiated."""
-    ab = AddressBook()
     assert isinstance(ab, AddressBook)
 
-def test_addressbook_add_and_search():
+def test_addressbook_add_and_search(ab):
     """Test adding and searching for an address (if supported)."""
-    ab = AddressBook()
     if hasattr(ab, "add") and hasattr(ab, "search"):
         ab.add("123 Main St", (51.5, -0.1))
         result = ab.search("123 Main St")
@@ -17,18 +20,16 @@ def test_addressbook_add_and_search():
         # If not implemented, pass the test
         pass
 
-def test_addressbook_empty_search():
+def test_addressbook_empty_search(ab):
     """Test searching for a non-existent address returns None or raises."""
-    ab = AddressBook()
     if hasattr(ab, "search"):
         result = ab.search("Nonexistent Address")
         assert result is None or result == ()
     else:
         pass
 
-def test_addressbook_invalid_add():
+def test_addressbook_invalid_add(ab):
     """Test adding an invalid address raises an error (if supported)."""
-    ab = AddressBook()
     if hasattr(ab, "add"):
         with pytest.raises(Exception):
             ab.add(None, None)
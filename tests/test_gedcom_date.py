@@ -76,15 +76,17 @@ def test_leap_year():
 
 
 # --- Additional tests for GEDCOM v7 date formats including BCE and calendars ---
-import pytest
 
-@pytest.mark.parametrize("date_str, year, month, day", [
+BCE_DATE_CASES = [
     ("44 BCE", -44, None, None),
     ("JUL 44 BCE", -44, 'JUL', None),
     ("15 MAR 44 BCE", -44, 'MAR', 15),
     ("JULIAN 44 BCE", -44, None, None),
     ("JULIAN 15 MAR 44 BCE", -44, 'MAR', 15),
-])
+]
+
+@pytest.mark.parametrize("date_str, year, month, day", BCE_DATE_CASES,
+                         ids=[case[0] for case in BCE_DATE_CASES])
 def test_bce_and_julian_dates(date_str, year, month, day):
     """Test BCE and Julian calendar date parsing."""
     gd = GedcomDate(date_str)
@@ -111,12 +113,15 @@ def test_french_and_hebrew_calendar(date_str):
     # Accept string fallback if not supported
     assert result is None or isinstance(result, GregorianDate) or isinstance(result, str)
 
-@pytest.mark.parametrize("date_str, expected", [
+BCE_RANGE_CASES = [
     ("BET 50 BCE AND 44 BCE", (-50, -44)),
     ("ABT 300 BCE", -300),
     ("BEF 100 BCE", -100),
     ("AFT 200 BCE", -200),
-])
+]
+
+@pytest.mark.parametrize("date_str, expected", BCE_RANGE_CASES,
+                         ids=[case[0] for case in BCE_RANGE_CASES])
 def test_bce_ranges_and_approx(date_str, expected):
     """Test BCE date ranges and approximate forms."""
     gd = GedcomDate(date_str, simplify_range_policy='none')
@@ -154,7 +159,6 @@ def test_invalid_bce():
 
 
 # --- Additional tests for full GEDCOM v7 date spec compliance ---
-import pytest
 
 @pytest.mark.parametrize("date_str, expected", [
     ("FROM 1670 TO 1800", (1670, 1800)),
@@ -218,3 +222,52 @@ def test_extension_calendar_and_month(date_str):
     result = gd.resolved
     # Accept string fallback if not supported
     assert result is None or isinstance(result, GregorianDate) or isinstance(result, str)
+
+
+def test_parse_is_shared_for_identical_strings():
+    """Test identical date strings reuse one parsed value, independent of range policy."""
+    gd1 = GedcomDate("BET 1900 AND 1910")
+    gd2 = GedcomDate("BET 1900 AND 1910", simplify_range_policy='last')
+    assert gd1.date is gd2.date
+    assert gd1.resolved.year == 1900
+    assert gd2.resolved.year == 1910
+
+@pytest.mark.parametrize("date_str", [
+    "1900", "0900", "1 JAN 1900", "01 jan 1900", "12 Dec 2000",
+    "ABT 1900", "abt 1900", "BEF 1 JAN 1900", "AFT 1850", "CAL 1777", "EST 16 JUN 1970",
+])
+def test_simple_date_fast_path_matches_ged4py(date_str):
+    """Test the [QUAL] YYYY / D MON YYYY fast path builds the same value DateValue.parse would."""
+    from ged4py.date import DateValue
+    from geo_gedcom.gedcom_date import _parse_simple_date
+    fast = _parse_simple_date(date_str)
+    slow = DateValue.parse(date_str)
+    assert type(fast) is type(slow)
+    assert fast == slow
+    assert fast.date.original == slow.date.original
+
+@pytest.mark.parametrize("date_str", ["INT 1900", "1 JANUARY 1900", "19000", "1900 BC", "JUL 1913", "ABT JUL 1913"])
+def test_simple_date_fast_path_defers_other_shapes(date_str):
+    """Test anything other than YYYY / D MON YYYY goes through the full parser."""
+    from geo_gedcom.gedcom_date import _parse_simple_date
+    assert _parse_simple_date(date_str) is None
+
+def test_year_num_is_memoized_per_string_and_policy():
+    """Test string year_num is cached by (string, policy) and still honours the policy."""
+    from geo_gedcom.gedcom_date import _year_num_for_string
+    _year_num_for_string.cache_clear()
+    assert GedcomDate("BET 1900 AND 1910").year_num == 1900
+    assert GedcomDate("BET 1900 AND 1910", simplify_range_policy='last').year_num == 1910
+    assert GedcomDate("BET 1900 AND 1910").year_num == 1900
+    info = _year_num_for_string.cache_info()
+    assert (info.hits, info.misses) == (1, 2)
+
+@pytest.mark.parametrize("year", [1000, 1900, 2100])
+def test_int_year_matches_ged4py(year):
+    """Test an integer year builds the same value as parsing its string, shared across instances."""
+    from ged4py.date import DateValue
+    gd = GedcomDate(year)
+    assert gd.date == DateValue.parse(str(year))
+    assert gd.date.date.original == str(year)
+    assert gd.year_num == year
+    assert GedcomDate(year).date is gd.date
@@ -34,9 +34,9 @@ def test_gedcom_parser_init_file(minimal_gedcom_file):
 def test_parse_people(minimal_gedcom_file):
     parser = GedcomParser(gedcom_file=minimal_gedcom_file)
     people = parser.people
-    assert isinstance(people, dict)
+    assert type(people) is dict
     assert len(people) == 1
-    person = next(iter(people.values()))
+    person = people["@I1@"]
     assert person.name == "John Doe"
     assert person.sex == "M"
     assert person.get_event('birth') is not None
@@ -44,6 +44,12 @@ def test_parse_people(minimal_gedcom_file):
     assert person.get_event('death') is not None
     assert person.get_event('death').place == "London, England"
 
+def test_parse_people_shares_place_strings(minimal_gedcom_file):
+    parser = GedcomParser(gedcom_file=minimal_gedcom_file)
+    person = parser.people["@I1@"]
+    # Repeated place names are interned, so events share one string object
+    assert person.get_event('birth').place is person.get_event('death').place
+
 def test_parse_people_no_file(tmp_path):
     # Should not raise, but return empty dict
     parser = GedcomParser(gedcom_file=tmp_path / "nonexistent.ged")
@@ -52,6 +58,17 @@ def test_parse_people_no_file(tmp_path):
     assert len(people) == 0
 
 
+def test_parse_people_missing_file_skips_processing(tmp_path, monkeypatch):
+    class _RaiseIfCalled:
+        def __init__(self, *args, **kwargs):
+            raise AssertionError("a missing file should not be fixed, converted or read")
+
+    monkeypatch.setattr(gedcom_parser_module, "GedcomFix", _RaiseIfCalled)
+    monkeypatch.setattr(gedcom_parser_module, "GedcomReader", _RaiseIfCalled)
+    parser = GedcomParser(gedcom_file=str(tmp_path / "nonexistent.ged"))
+    assert parser.gedcom_file == tmp_path / "nonexistent.ged"
+    assert parser.people == {}
+
 @pytest.fixture
 def family_gedcom_file(tmp_path):
     content = (
@@ -101,3 +118,84 @@ def test_get_full_address_list_from_people_without_second_parse(family_gedcom_fi
     assert "London, England" in addresses
     assert "Paris, France" in addresses
     assert "Berlin, Germany" in addresses
+
+
+def test_check_photo_tags_single_pass(minimal_gedcom_file, tmp_path):
+    parser = GedcomParser(gedcom_file=minimal_gedcom_file)
+    assert parser._check_photo_tags(minimal_gedcom_file) == (False, False)
+
+    photo_file = tmp_path / "photo.ged"
+    photo_file.write_text(
+        "0 @I1@ INDI\n"
+        "1 NAME Jane /Doe/\n"
+        "1 OBJE\n"
+        "2 FILE jane.jpg\n"
+        "1 _PHOTO @M1@\n"
+        "0 TRLR\n",
+        encoding='utf-8',
+    )
+    assert parser._check_photo_tags(photo_file) == (True, True)
+    assert parser._check_if_tag_used(photo_file, "OBJE") is True
+    assert parser._check_if_tag_used(photo_file, "_FOO") is False
+
+
+def test_get_full_address_list_is_cached(family_gedcom_file, monkeypatch):
+    parser = GedcomParser(gedcom_file=family_gedcom_file)
+
+    addresses = parser.get_full_address_list()
+
+    def _raise_if_called(self):
+        raise AssertionError("address list should be served from the cache")
+
+    monkeypatch.setattr(GedcomParser, "_get_full_address_list_from_people", _raise_if_called)
+    parser._all_places = {}
+
+    assert parser.get_full_address_list() is addresses
+
+
+def test_get_full_address_list_uses_places_recorded_at_parse(family_gedcom_file, monkeypatch):
+    parser = GedcomParser(gedcom_file=family_gedcom_file)
+
+    def _raise_if_called(self):
+        raise AssertionError("people should not be walked when places were recorded at parse time")
+
+    monkeypatch.setattr(GedcomParser, "_get_full_address_list_from_people", _raise_if_called)
+
+    addresses = parser.get_full_address_list()
+    assert len(addresses) == len(set(addresses))
+    assert {"London, England", "Paris, France", "Berlin, Germany"} <= set(addresses)
+
+
+def test_recorded_places_match_people_walk_with_partnerless_family(tmp_path):
+    file_path = tmp_path / "partnerless.ged"
+    file_path.write_text(
+        "0 @I1@ INDI\n"
+        "1 NAME John /Doe/\n"
+        "1 BIRT\n"
+        "2 PLAC London, England\n"
+        "1 RESI\n"
+        "2 PLAC  Leeds, England \n"
+        "0 @I2@ INDI\n"
+        "1 NAME Jane /Roe/\n"
+        "1 BIRT\n"
+        "2 PLAC Paris, France\n"
+        "0 @F1@ FAM\n"
+        "1 HUSB @I1@\n"
+        "1 WIFE @I2@\n"
+        "1 MARR\n"
+        "2 PLAC Berlin, Germany\n"
+        "0 @F2@ FAM\n"
+        "1 MARR\n"
+        "2 PLAC Nowhere Town\n"
+        "0 TRLR\n",
+        encoding="utf-8",
+    )
+    parser = GedcomParser(gedcom_file=file_path)
+
+    recorded = list(parser._all_places)
+    walked = parser._get_full_address_list_from_people()
+
+    # Same places as the people walk, but in file order: INDI events first, then FAM marriages
+    assert "Nowhere Town" not in recorded
+    assert recorded == ["London, England", "Leeds, England", "Paris, France", "Berlin, Germany"]
+    assert walked == ["London, England", "Berlin, Germany", "Leeds, England", "Paris, France"]
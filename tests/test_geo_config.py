@@ -41,6 +41,13 @@ def test_geo_config_get_set():
     assert 'test_key' in all_config
     assert all_config['test_key'] == 'test_value'
 
+def test_geo_config_uses_slots():
+    """Test GeoConfig instances have no per-instance __dict__."""
+    config = GeoConfig()
+    assert not hasattr(config, '__dict__')
+    with pytest.raises(AttributeError):
+        config.unexpected_attribute = True
+
 def test_geo_config_update_from_dict():
     """Test update_geo_config method to update multiple settings from a dict."""
     config = GeoConfig()
@@ -25,3 +25,16 @@ def test_import_failure():
     """Test that importing a non-existent symbol raises ImportError or AttributeError."""
     with pytest.raises((ImportError, AttributeError)):
         from geo_gedcom import NotARealClass
+
+
+def test_heavy_dependencies_are_imported_lazily():
+    """Test that importing geo_gedcom alone does not load geopy, rapidfuzz or pycountry."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, geo_gedcom; "
+        "print(','.join(m for m in ('geopy', 'rapidfuzz', 'pycountry') if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ""
@@ -3,7 +3,7 @@ import csv
 from geo_gedcom import GeoCache
 from geo_gedcom.location import Location
 from geo_gedcom.lat_lon import LatLon
-from geo_gedcom.geocache import GeoCacheEntry
+from geo_gedcom.geocache import GeoCacheEntry, GEO_CACHE_FIELDS
 
 def test_geocache_init(tmp_path):
     """Test GeoCache initialization with a valid file path."""
@@ -90,6 +90,37 @@ def test_geocache_save_and_load(tmp_path):
     assert float(cache_entry.latitude) == 48.8566
     assert float(cache_entry.longitude) == 2.3522
 
+def test_geocache_save_writes_fixed_header(tmp_path):
+    """Test that the saved cache CSV uses the fixed GEO_CACHE_FIELDS column order."""
+    cache_file = tmp_path / "geocache.csv"
+    gc = GeoCache(str(cache_file), always_geocode=False)
+    gc.add_no_result_entry('Somewhere')
+    gc.add_no_result_entry('Elsewhere')
+    gc.save_geo_cache()
+
+    with open(cache_file, newline='', encoding='utf-8') as f:
+        rows = list(csv.reader(f))
+    assert tuple(rows[0]) == GEO_CACHE_FIELDS
+    assert len(rows) == 3
+
+def test_geocache_add_entries_and_skip_unchanged_save(tmp_path):
+    """Test bulk add_entries and that saving an unchanged cache leaves the file alone."""
+    cache_file = tmp_path / "geocache.csv"
+    gc1 = GeoCache(str(cache_file), always_geocode=False)
+    gc1.add_entries([
+        ('Rome', GeoCacheEntry(address='Rome', latitude='41.9', longitude='12.5', country_code='IT')),
+        ('Oslo', GeoCacheEntry(address='Oslo', latitude='59.9', longitude='10.8', country_code='NO')),
+    ])
+    _, entry = gc1.lookup_geo_cache_entry('ROME')
+    assert entry.country_code == 'IT'
+    gc1.save_geo_cache()
+
+    gc2 = GeoCache(str(cache_file), always_geocode=False)
+    assert len(gc2.geo_cache) == 2
+    cache_file.write_text("sentinel", encoding='utf-8')
+    gc2.save_geo_cache()
+    assert cache_file.read_text(encoding='utf-8') == "sentinel"
+
 def test_geocache_case_insensitive_lookup(tmp_path):
     """Test that geocache lookups are case-insensitive."""
     cache_file = tmp_path / "geocache.csv"
@@ -117,6 +148,27 @@ def test_geocache_case_insensitive_lookup(tmp_path):
     assert entry3 is not None
     assert entry1.country_code == entry2.country_code == entry3.country_code == 'US'
 
+def test_geocache_casefolded_lookup(tmp_path):
+    """Test that geocache lookups fold Unicode case, not just ASCII lower-casing."""
+    cache_file = tmp_path / "geocache.csv"
+    gc = GeoCache(str(cache_file), always_geocode=False)
+    
+    location = Location(
+        used=1,
+        latlon=LatLon(48.1374, 11.5755),
+        country_code='DE',
+        country_name='Germany',
+        continent='Europe',
+        found_country=True,
+        address='Hauptstraße, München'
+    )
+    
+    gc.add_geo_cache_entry('Hauptstraße, München', location)
+    
+    _, entry = gc.lookup_geo_cache_entry('HAUPTSTRASSE, MÜNCHEN')
+    assert entry is not None
+    assert entry.country_code == 'DE'
+
 def test_geocache_empty_when_always_geocode(tmp_path):
     """Test that cache is not loaded when always_geocode is True."""
     cache_file = tmp_path / "geocache.csv"
@@ -164,6 +216,15 @@ def test_geocache_entry_from_dict():
     assert entry.timestamp == 1234567890.5
     assert entry.used == 3
 
+def test_geocache_entry_from_dict_coercion_edge_cases():
+    """Test GeoCacheEntry.from_dict handles 'false', blanks and malformed numbers."""
+    entry = GeoCacheEntry.from_dict({'address': 'A', 'found_country': 'False', 'no_result': ' Yes ',
+                                     'timestamp': '', 'used': 'n/a'})
+    assert entry.found_country is False
+    assert entry.no_result is True
+    assert entry.timestamp == 0.0
+    assert entry.used == 0
+
 def test_geocache_entry_as_dict():
     """Test GeoCacheEntry.as_dict serialization."""
     entry = GeoCacheEntry(
@@ -184,6 +245,15 @@ def test_geocache_entry_as_dict():
     assert d['timestamp'] == '1234567890.5'
     assert d['used'] == '2'
 
+def test_geocache_entry_slots_and_equality():
+    """Test GeoCacheEntry has no per-instance __dict__ and compares by value."""
+    entry = GeoCacheEntry(address='Test', latitude='51.5', used=2)
+    with pytest.raises(AttributeError):
+        entry.unexpected_attribute = True
+    assert entry == GeoCacheEntry(address='Test', latitude='51.5', used=2)
+    assert entry != GeoCacheEntry(address='Test', latitude='51.6', used=2)
+    assert 'Test' in repr(entry)
+
 def test_geocache_cache_only_no_retry_failed(tmp_path):
     """Test that cache_only mode does not retry failed lookups."""
     import time
@@ -226,3 +296,31 @@ def test_geocache_non_cache_only_retries_failed(tmp_path):
     assert cache_entry is None
     # Verify the entry was deleted from cache (which happens when retry is triggered)
     assert 'failed place' not in gc2.geo_cache
+
+def test_geocache_entry_added_during_save_is_saved_next_time(tmp_path, monkeypatch):
+    """Test an entry added while a save is writing keeps the cache dirty for the next save."""
+    import threading
+    cache_file = tmp_path / "geocache.csv"
+    gc = GeoCache(str(cache_file), always_geocode=False)
+    gc.add_no_result_entry('Early')
+    original_as_dict = GeoCacheEntry.as_dict
+
+    def as_dict_adding_late_entry(entry):
+        if 'late' not in gc.geo_cache:
+            gc.add_no_result_entry('Late')
+        return original_as_dict(entry)
+
+    monkeypatch.setattr(GeoCacheEntry, 'as_dict', as_dict_adding_late_entry)
+    gc.save_geo_cache(lock=threading.Lock())
+    monkeypatch.undo()
+    assert len(GeoCache(str(cache_file), always_geocode=False).geo_cache) == 1
+
+    gc.save_geo_cache()
+    assert len(GeoCache(str(cache_file), always_geocode=False).geo_cache) == 2
+
+def test_geocache_failed_save_stays_dirty(tmp_path):
+    """Test a save that cannot write the file leaves the cache marked unsaved."""
+    gc = GeoCache(str(tmp_path), always_geocode=False)
+    gc.add_no_result_entry('Somewhere')
+    gc.save_geo_cache()
+    assert gc._dirty is True
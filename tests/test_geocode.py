@@ -1,6 +1,7 @@
 import pytest
 from geo_gedcom.geocode import Geocode
 from geo_gedcom.geo_config import GeoConfig
+from geo_gedcom.lat_lon import LatLon
 
 def test_geocode_class_exists():
     assert Geocode is not None
@@ -44,3 +45,71 @@ def test_geocode_empty_address(tmp_path, monkeypatch):
         monkeypatch.setattr(geocoder, "geocode", lambda addr: None)
         result = geocoder.geocode("")
         assert result is None
+
+def test_lookup_locations_preserves_order(tmp_path, monkeypatch):
+    cache_file = tmp_path / "geocode_cache.csv"
+    geo_config = GeoConfig()
+    geo_config.update_geo_config({'geocode_settings': {'default_country': '', 'max_workers': 4}})
+    geocoder = Geocode(str(cache_file), geo_config)
+    places = [f"Place {i}" for i in range(20)]
+    # Geocode is slotted, so patch the class rather than the instance
+    monkeypatch.setattr(Geocode, "lookup_location", lambda self, place: place.upper())
+    assert list(geocoder.lookup_locations(places)) == [(p, p.upper()) for p in places]
+
+def test_rate_limit_spaces_reserved_slots(tmp_path):
+    cache_file = tmp_path / "geocode_cache.csv"
+    geo_config = GeoConfig()
+    geo_config.update_geo_config({'geocode_settings': {'default_country': '', 'rate_limit_seconds': 0.01}})
+    geocoder = Geocode(str(cache_file), geo_config)
+    geocoder._wait_for_rate_limit()
+    first = geocoder._last_geocode_time
+    geocoder._wait_for_rate_limit()
+    assert geocoder._last_geocode_time >= first + 0.01
+
+def test_app_hooks_resolved_on_assignment(tmp_path):
+    cache_file = tmp_path / "geocode_cache.csv"
+    geo_config = GeoConfig()
+    geo_config.update_geo_config({'geocode_settings': {'default_country': ''}})
+    geocoder = Geocode(str(cache_file), geo_config)
+    assert geocoder._stop_requested() is False
+
+    class _StopHooks:
+        def stop_requested(self):
+            return True
+
+    # Partial hooks objects are fine: missing callbacks are simply skipped
+    geocoder.app_hooks = _StopHooks()
+    assert geocoder._stop_requested(logger_stop_message="") is True
+    geocoder._report_step("no report_step hook")
+
+def test_lookup_locations_threaded_with_stub_geocoder(tmp_path):
+    from types import SimpleNamespace
+
+    class _StubGeolocator:
+        def geocode(self, address, **kwargs):
+            if address.casefold().startswith("nowhere"):
+                return None
+            return SimpleNamespace(latitude=51.5, longitude=-0.1, address=address,
+                                   raw={'address': {'country': 'United Kingdom', 'country_code': 'gb'}})
+
+    cache_file = tmp_path / "geocode_cache.csv"
+    geo_config = GeoConfig()
+    geo_config.update_geo_config({'geocode_settings': {'default_country': '', 'max_workers': 4,
+                                                       'rate_limit_seconds': 0.0}})
+    geocoder = Geocode(str(cache_file), geo_config)
+    assert geocoder.max_workers == 4
+    geocoder.geolocator = _StubGeolocator()
+    places = [f"Town {i}" for i in range(12)] + ["Nowhere"]
+    results = list(geocoder.lookup_locations(places))
+    assert [place for place, _ in results] == places
+    assert all(location.latlon == LatLon(51.5, -0.1) for _, location in results[:-1])
+    assert results[-1][1] is None
+    assert geocoder.num_geocoded == len(places)
+    assert len(geocoder.geo_cache.geo_cache) == len(places)
+    assert geocoder.geo_cache.geo_cache['nowhere'].no_result
+
+def test_max_workers_defaults_to_sequential(tmp_path):
+    cache_file = tmp_path / "geocode_cache.csv"
+    geo_config = GeoConfig()
+    geo_config.update_geo_config({'geocode_settings': {'default_country': ''}})
+    assert Geocode(str(cache_file), geo_config).max_workers == 1
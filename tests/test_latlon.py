@@ -28,4 +28,31 @@ def test_latlon_str_repr():
     """Test __str__ and __repr__ methods for LatLon if implemented."""
     ll = LatLon(10.0, 20.0)
     assert "10.0" in str(ll)
-    assert "20.0" in repr(ll)
\ No newline at end of file
+    assert "20.0" in repr(ll)
+def test_latlon_value_equality_and_hash():
+    """Test LatLon compares and hashes by value and is immutable."""
+    ll = LatLon(51.5, -0.1)
+    assert ll == LatLon("N51.5", "W0.1")
+    assert ll != LatLon(51.5, 0.1)
+    assert len({ll, LatLon(51.5, -0.1), LatLon(0.0, 0.0)}) == 2
+    with pytest.raises(AttributeError):
+        ll.lat = 0.0
+
+def test_latlon_numeric_inputs_stored_as_float():
+    """Test int and float inputs are both stored as plain floats."""
+    ll = LatLon(51, -0.5)
+    assert type(ll.lat) is float and ll.lat == 51.0
+    assert type(ll.lon) is float and ll.lon == -0.5
+
+def test_latlon_copy_deepcopy_and_pickle():
+    """Test an immutable LatLon still round-trips through copy, deepcopy and pickle."""
+    import copy
+    import pickle
+    from geo_gedcom.location import Location
+    ll = LatLon(51.5, -0.1)
+    assert copy.copy(ll) == ll
+    assert copy.deepcopy(ll) == ll
+    assert pickle.loads(pickle.dumps(ll)) == ll
+    assert LatLon(None, None) == pickle.loads(pickle.dumps(LatLon(None, None)))
+    location = Location(latlon=ll, address='London')
+    assert copy.deepcopy(location).latlon == ll
@@ -1,18 +1,19 @@
 import pytest
 from geo_gedcom import LifeEvent, LatLon
 
+LIFE_EVENT_CASES = (
+    ("London", "1900", "BIRT", 1900, None, "London"),
+    ("Luanshya, Zambia", "16 JUN 1970", "BIRT", 1970, "JUN", "Luanshya, Zambia"),
+    (None, "1759", "BIRT", 1759, None, None),
+    (None, "ABT 1762", "BIRT", 1762, None, None),
+    ("Eastfield, Hickling, Norfolk, England", "1841", "RESI", 1841, None, "Eastfield, Hickling, Norfolk, England"),
+    ("Norfolk, England", "13 NOV 1831", "BAPM", 1831, "NOV", "Norfolk, England"),
+    ("Swansea, Glamorgan, Wales", "24 NOV 1990", "DEAT", 1990, "NOV", "Swansea, Glamorgan, Wales"),
+    ("North Mymms, Welwyn Hatfield District, Hertfordshire, England", "1812", "BURI", 1812, None, "North Mymms, Welwyn Hatfield District, Hertfordshire, England"),
+)
+
 @pytest.mark.parametrize(
-    "place,date,what,expected_year,expected_month,expected_place",
-    [
-        ("London", "1900", "BIRT", 1900, None, "London"),
-        ("Luanshya, Zambia", "16 JUN 1970", "BIRT", 1970, "JUN", "Luanshya, Zambia"),
-        (None, "1759", "BIRT", 1759, None, None),
-        (None, "ABT 1762", "BIRT", 1762, None, None),
-        ("Eastfield, Hickling, Norfolk, England", "1841", "RESI", 1841, None, "Eastfield, Hickling, Norfolk, England"),
-        ("Norfolk, England", "13 NOV 1831", "BAPM", 1831, "NOV", "Norfolk, England"),
-        ("Swansea, Glamorgan, Wales", "24 NOV 1990", "DEAT", 1990, "NOV", "Swansea, Glamorgan, Wales"),
-        ("North Mymms, Welwyn Hatfield District, Hertfordshire, England", "1812", "BURI", 1812, None, "North Mymms, Welwyn Hatfield District, Hertfordshire, England"),
-    ]
+    "place,date,what,expected_year,expected_month,expected_place", LIFE_EVENT_CASES
 )
 def test_life_event_various(place, date, what, expected_year, expected_month, expected_place):
     """Test LifeEvent creation for various event types and date formats."""
@@ -32,29 +33,47 @@ def test_life_event_with_location():
     assert event.location.latlon.lat == 51.5
     assert event.location.latlon.lon == -0.1
 
-@pytest.mark.parametrize(
-    "place,date,what",
-    [
-        (None, None, "BIRT"),
-        ("", "", "BIRT"),
-        ("Unknown", "INVALID DATE", "BIRT"),
-        ("Somewhere", "2020", "UNKNOWN"),
-    ]
+LIFE_EVENT_EDGE_CASES = (
+    (None, None, "BIRT", None),
+    ("", "", "BIRT", None),
+    ("Unknown", "INVALID DATE", "BIRT", None),
+    ("Somewhere", "2020", "UNKNOWN", 2020),
 )
-def test_life_event_edge_cases(place, date, what):
+
+@pytest.mark.parametrize("place,date,what,expected_year", LIFE_EVENT_EDGE_CASES)
+def test_life_event_edge_cases(place, date, what, expected_year):
     """Test LifeEvent with missing, empty, or invalid data."""
     event = LifeEvent(place=place, date=date, what=what)
     assert event.what == what
     # Place may be None or empty string
     assert event.place == place
-    # Date parsing: year_num may be None for invalid date
-    if date and date.isdigit():
-        assert event.date.year_num == int(date)
-    elif date and "INVALID" in date:
-        assert event.date.year_num is None
+    # Date parsing: year_num is None for a missing, empty or invalid date
+    assert event.date.year_num == expected_year
 
 def test_life_event_repr_str():
     """Test __repr__ and __str__ methods for LifeEvent (if implemented)."""
     event = LifeEvent(place="London", date="1900", what="BIRT")
     assert "London" in repr(event)
     assert "BIRT" in str(event)
+    assert str(LifeEvent(place="", what=None)) == "None : None - (None,None) "
+
+def test_life_event_interns_place_and_what():
+    """Test equal place and event-tag strings from separate sources share one object."""
+    place_a = "".join(["Ryde, Isle of Wight", ", England"])
+    place_b = "".join(["Ryde, Isle of", " Wight, England"])
+    assert place_a is not place_b
+    e1 = LifeEvent(place=place_a, date="1900", what="".join(["BI", "RT"]))
+    e2 = LifeEvent(place=place_b, date="16 jun 1970", what="".join(["BIR", "T"]))
+    assert e1.place is e2.place
+    assert e1.what is e2.what
+
+def test_life_event_getattr_aliases():
+    """Test LifeEvent.getattr resolves each alias and returns None for unknown names."""
+    event = LifeEvent(place="London", date="1900", latlon=LatLon(51.5, -0.1), what="BIRT")
+    assert event.getattr('where') == event.getattr('place') == event.getattr('location') == "London"
+    assert event.getattr('when_year_num') == 1900
+    assert event.getattr('when').year == event.getattr('date').year == 1900
+    assert event.getattr('latlon') == LatLon(51.5, -0.1)
+    assert event.getattr('what') == "BIRT"
+    assert LifeEvent(place=None).getattr('what') == ""
+    assert event.getattr('not_an_alias') is None
@@ -5,7 +5,7 @@ from geo_gedcom.life_event_set import LifeEventSet
 from geo_gedcom.gedcom_date import GedcomDate
 
 def make_event(what, year=None, place=None):
-    return LifeEvent(place=place, date=GedcomDate(str(year)) if year else None, what=what)
+    return LifeEvent(place=place, date=GedcomDate(year) if year is not None else None, what=what)
 
 def test_add_and_get_single_event():
     les = LifeEventSet()
@@ -18,7 +18,7 @@ def test_add_multiple_events():
     les = LifeEventSet()
     e1 = make_event('BIRT', 1900)
     e2 = make_event('BIRT', 1901)
-    les.add_events('BIRT', [e1, e2])
+    les.add_events('BIRT', [e1, None, e2])
     assert les.get_events('BIRT') == [e1, e2]
 
 def test_get_events_all():
@@ -28,7 +28,7 @@ def test_get_events_all():
     les.add_event('BIRT', e1)
     les.add_event('DEAT', e2)
     all_events = les.get_events('all')
-    assert set(all_events) == {e1, e2}
+    assert {id(ev) for ev in all_events} == {id(e1), id(e2)}
 
 def test_event_type_enforcement():
     les = LifeEventSet(event_types=['BIRT'], allow_new_event_types=False)
@@ -46,6 +46,42 @@ def test_date_order_sorting():
     sorted_events = les.get_events('BIRT', date_order=True)
     assert [e.date.year_num for e in sorted_events] == [1901, 1902, 1903]
 
+def test_date_order_cache_refreshes_after_add():
+    les = LifeEventSet()
+    e1 = make_event('BIRT', 1902)
+    e2 = make_event('BIRT', 1901)
+    les.add_events('BIRT', [e1, e2])
+    assert les.get_events('BIRT', date_order=True) == [e2, e1]
+    assert les.get_events('all', date_order=True) == [e2, e1]
+    # Returned lists are copies; mutating one must not affect the next call
+    les.get_events('BIRT', date_order=True).clear()
+    e0 = make_event('BIRT', 1900)
+    les.add_event('BIRT', e0)
+    assert les.get_events('BIRT', date_order=True) == [e0, e2, e1]
+    assert les.get_events('all', date_order=True) == [e0, e2, e1]
+
+def test_date_order_add_merges_into_cached_order():
+    les = LifeEventSet()
+    first = [make_event('RESI', y) for y in (1930, 1910)]
+    les.add_events('RESI', first)
+    assert les.get_events('RESI', date_order=True) == [first[1], first[0]]
+    later = [make_event('RESI', y) for y in (1930, 1920, 1910)]
+    les.add_events('RESI', later)
+    # Same result as a full stable sort: equal years keep insertion order
+    assert les.get_events('RESI', date_order=True) == [first[1], later[2], later[1], first[0], later[0]]
+
+def test_date_order_all_merges_types():
+    les = LifeEventSet()
+    birth = make_event('BIRT', 1900)
+    resi = [make_event('RESI', y) for y in (1930, 1910, 1950)]
+    death = make_event('DEAT', 1940)
+    les.add_event('BIRT', birth)
+    les.add_events('RESI', resi)
+    les.add_event('DEAT', death)
+    ordered = les.get_events('all', date_order=True)
+    assert [e.date.year_num for e in ordered] == [1900, 1910, 1930, 1940, 1950]
+    assert les.get_event('all', date_order=True) is birth
+
 def test_get_event_with_date_order():
     les = LifeEventSet()
     e1 = make_event('BIRT', 1902)
@@ -63,3 +99,9 @@ def test_add_none_event():
     les = LifeEventSet()
     les.add_event('BIRT', None)
     assert les.get_events('BIRT') == []
+
+def test_life_event_set_uses_slots():
+    les = LifeEventSet()
+    assert not hasattr(les, '__dict__')
+    with pytest.raises(AttributeError):
+        les.unexpected_attribute = True
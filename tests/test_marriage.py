@@ -2,16 +2,18 @@ import pytest
 from geo_gedcom.marriage import Marriage
 
 class MockPerson:
+    __slots__ = ('name',)
+
     def __init__(self, name):
         self.name = name
     def __str__(self):
         return self.name
     def __repr__(self):
         return f"MockPerson({self.name!r})"
-    def __eq__(self, other):
-        return isinstance(other, MockPerson) and self.name == other.name
 
 class MockLifeEvent:
+    __slots__ = ('desc',)
+
     def __init__(self, desc):
         self.desc = desc
     def __str__(self):
@@ -19,22 +21,25 @@ class MockLifeEvent:
     def __repr__(self):
         return f"MockLifeEvent({self.desc!r})"
 
+# Shared, never-mutated instances; equality is identity, as for real Person objects.
+_PEOPLE = {name: MockPerson(name) for name in ("Alice", "Bob", "Charlie")}
+
 def test_marriage_init_defaults():
     m = Marriage()
     assert m.people_list == []
     assert m.event is None
 
 def test_marriage_init_with_people_and_event():
-    p1 = MockPerson("Alice")
-    p2 = MockPerson("Bob")
+    p1 = _PEOPLE['Alice']
+    p2 = _PEOPLE['Bob']
     evt = MockLifeEvent("Married in Paris")
     m = Marriage([p1, p2], evt)
     assert m.people_list == [p1, p2]
     assert m.event == evt
 
 def test_marriage_str_and_repr():
-    p1 = MockPerson("Alice")
-    p2 = MockPerson("Bob")
+    p1 = _PEOPLE['Alice']
+    p2 = _PEOPLE['Bob']
     evt = MockLifeEvent("Married in Paris")
     m = Marriage([p1, p2], evt)
     s = str(m)
@@ -43,9 +48,9 @@ def test_marriage_str_and_repr():
     assert "MockPerson('Alice')" in r and "MockLifeEvent('Married in Paris')" in r
 
 def test_other_partners_and_partner():
-    p1 = MockPerson("Alice")
-    p2 = MockPerson("Bob")
-    p3 = MockPerson("Charlie")
+    p1 = _PEOPLE['Alice']
+    p2 = _PEOPLE['Bob']
+    p3 = _PEOPLE['Charlie']
     m = Marriage([p1, p2, p3], MockLifeEvent("Group wedding"))
     # Exclude p1, should get [p2, p3]
     others = m.other_partners(p1)
@@ -57,7 +62,12 @@ def test_other_partners_and_partner():
     assert solo.partner(p1) is None
 
 def test_other_partners_empty():
-    p1 = MockPerson("Alice")
+    p1 = _PEOPLE['Alice']
     m = Marriage([p1], MockLifeEvent("Solo wedding"))
     assert m.other_partners(p1) == []
-    
\ No newline at end of file
+    
+def test_other_partners_excludes_by_identity():
+    twin = MockPerson("Alice")
+    m = Marriage([_PEOPLE['Alice'], twin], MockLifeEvent("Namesake wedding"))
+    assert m.other_partners(_PEOPLE['Alice']) == [twin]
+    assert m.partner(twin) is _PEOPLE['Alice']
@@ -3,6 +3,12 @@ from geo_gedcom import Person
 from geo_gedcom import LifeEvent
 from geo_gedcom.gedcom_date import GedcomDate
 
+PERSON_NAME_CASES = (
+    ("Herbert Campbell /Westmorland/", "Herbert Campbell", "Westmorland", None),
+    ("Herbert /Westmorland/", "Herbert", "Westmorland", None),
+    ("Herbert C /Westmorland/", "Herbert C", "Westmorland", None),
+)
+
 @pytest.fixture
 def mock_event() -> callable:
     def _event(year=None, month=None, place=None, lat=None, lon=None) -> LifeEvent:
@@ -20,14 +26,7 @@ def test_person_init():
     assert p.xref_id == "I1"
     assert p.name is None
 
-@pytest.mark.parametrize(
-    "name,firstname,surname,maidenname",
-    [
-        ("Herbert Campbell /Westmorland/", "Herbert Campbell", "Westmorland", None),
-        ("Herbert /Westmorland/", "Herbert", "Westmorland", None),
-        ("Herbert C /Westmorland/", "Herbert C", "Westmorland", None),
-    ]
-)
+@pytest.mark.parametrize("name,firstname,surname,maidenname", PERSON_NAME_CASES)
 def test_person_multiple_names(name, firstname, surname, maidenname):
     p = Person("I635")
     p.name = name